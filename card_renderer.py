@@ -3,9 +3,14 @@ import os
 import re
 import hashlib
 import asyncio
+import threading
 import aiohttp
+from collections import OrderedDict
 from pathlib import Path
 from functools import lru_cache
+from itertools import accumulate
+from bisect import bisect_right
+import PIL
 from PIL import Image, ImageDraw, ImageFont
 from typing import Optional
 
@@ -50,6 +55,48 @@ TIER_COLORS = {
     "Legendary": (255, 165, 0),
 }
 
+# 新闻/补丁正文中的 Markdown 标题：str.startswith 接受元组，普通行一次调用即可排除
+HEADING_PREFIXES = ("# ", "## ", "### ")
+# 标题级别（# 的个数）对应的颜色
+HEADING_COLORS = {1: COLORS["accent"], 2: COLORS["green"], 3: COLORS["orange"]}
+
+# Tier List 卡片：评级标签颜色与物品边框颜色
+GRADE_COLORS = {
+    "S": (255, 69, 58),
+    "A": (255, 159, 10),
+    "B": (50, 215, 75),
+    "C": (100, 210, 255),
+}
+
+TIER_BORDER_COLORS = {
+    "Bronze": (205, 127, 50),
+    "Silver": (192, 192, 192),
+    "Gold": (255, 215, 0),
+    "Diamond": (185, 242, 255),
+    "Legendary": (255, 121, 198),
+}
+
+TIER_CN_MAP = {"Bronze": "青铜", "Silver": "白银", "Gold": "黄金", "Diamond": "钻石", "Legendary": "传说"}
+HERO_CN_MAP = {
+    "Common": "通用", "Dooley": "杜利", "Jules": "朱尔斯",
+    "Mak": "马克", "Pygmalien": "皮格马利翁", "Stelle": "斯黛拉", "Vanessa": "瓦妮莎",
+}
+
+# 物品数值字段：数值键 -> (各品质数值键, 显示名)，按展示顺序排列
+_STAT_META = {
+    "damage": ("damage_tiers", "伤害"),
+    "heal": ("heal_tiers", "治疗"),
+    "shield": ("shield_tiers", "护盾"),
+    "burn": ("burn_tiers", "灼烧"),
+    "poison": ("poison_tiers", "中毒"),
+    "regen": ("regen_tiers", "再生"),
+    "lifesteal": ("lifesteal_tiers", "吸血"),
+    "ammo": ("ammo_tiers", "弹药"),
+    "crit": ("crit_tiers", "暴击"),
+    "multicast": ("multicast_tiers", "多重触发"),
+}
+_STAT_KEYS = frozenset(_STAT_META)
+
 SCALE = 2
 
 CARD_WIDTH = 520 * SCALE
@@ -77,6 +124,8 @@ DESC_GAP = 4 * SCALE
 SKILL_DESC_GAP = 6 * SCALE
 THUMB_SIZE = 96 * SCALE
 THUMB_MARGIN = 108 * SCALE
+# 缩略图的缩小滤镜：小尺寸头像用 BOX 面积平均即可，LANCZOS 开销数倍而肉眼无差别
+THUMBNAIL_FILTER = Image.BOX
 
 FONT_SIZE_TITLE = 28 * SCALE
 FONT_SIZE_TITLE_SMALL = 26 * SCALE
@@ -85,27 +134,87 @@ FONT_SIZE_BODY = 16 * SCALE
 FONT_SIZE_SMALL = 14 * SCALE
 FONT_SIZE_TAG = 13 * SCALE
 FONT_SIZE_LINK = 12 * SCALE
+FONT_SIZE_NEWS_TITLE = 24 * SCALE
+FONT_SIZE_NEWS_BODY = 15 * SCALE
+
+PRELOAD_FONT_SIZES = (
+    FONT_SIZE_TITLE, FONT_SIZE_TITLE_SMALL, FONT_SIZE_SUBTITLE, FONT_SIZE_BODY,
+    FONT_SIZE_SMALL, FONT_SIZE_TAG, FONT_SIZE_LINK, FONT_SIZE_NEWS_TITLE, FONT_SIZE_NEWS_BODY,
+)
+
+# Pillow-SIMD 与 Pillow 接口完全兼容，版本号带 ".postN" 后缀；缩放、粘贴等操作有 SIMD 加速
+PILLOW_SIMD = ".post" in PIL.__version__
 
 _CJK_RANGES = re.compile(r'[\u4e00-\u9fff\u3000-\u303f\uff00-\uffef]')
 
+# 卡片 PNG 的 zlib 压缩级别：1 级编码速度约为 optimize(9 级) 的数倍，体积仅略大
+CARD_PNG_COMPRESS_LEVEL = 1
+# 纯文字卡片（无缩略图）转为调色板模式的颜色数：编码耗时不变，体积约为 RGB 的 40%
+CARD_PALETTE_COLORS = 256
+
 # 图片缓存过期时间（秒）
 IMAGE_CACHE_MAX_AGE = 7 * 24 * 3600  # 7 天
 # 最大缓存文件数
 IMAGE_CACHE_MAX_FILES = 500
-
-
+# 写缓存的临时文件超过该时长仍在，视为写入中途崩溃的残留（秒）
+IMAGE_CACHE_TMP_MAX_AGE = 3600  # 1 小时
+# 解码时的最小目标尺寸，JPEG 等支持 draft 的格式可按比例缩小解码（需覆盖所有缩略图尺寸）
+IMAGE_DRAFT_SIZE = (128 * SCALE, 128 * SCALE)
+# 已解码图片的内存缓存上限（LRU 淘汰）
+IMAGE_MEMORY_CACHE_MAX_ITEMS = 128
+# 换行结果缓存条目上限
+WRAP_CACHE_MAX_ENTRIES = 2048
+# 短文本（品质徽章、标签、属性名、百分比）宽度与包围盒缓存条目上限
+TEXT_WIDTH_CACHE_MAX_ENTRIES = 2048
+# 头部底板模板缓存上限（头部高度随标题行数变化，种类很少）
+HEADER_TEMPLATE_MAX_ITEMS = 32
+
+
+@lru_cache(maxsize=256)
 def _clean_tier(raw: str) -> str:
     if not raw:
         return ""
     return raw.split("/")[0].strip().split(" ")[0].strip()
 
 
+@lru_cache(maxsize=256)
+def _tier_color(tier_str: str) -> tuple:
+    """原始品质字符串（如 "Gold / 黄金"）对应的颜色"""
+    return TIER_COLORS.get(_clean_tier(tier_str), COLORS["text_dim"])
+
+
 def _get_skill_text(skill_entry) -> str:
     if isinstance(skill_entry, dict):
         return skill_entry.get("cn", "") or skill_entry.get("en", "")
     return str(skill_entry)
 
 
+class _DrawOps:
+    """布局阶段记录的绘制指令，画布高度确定后按纵向偏移一次性回放"""
+
+    __slots__ = ("ops",)
+
+    def __init__(self):
+        self.ops: list[tuple] = []
+
+    def text(self, x, y, text, font, fill):
+        self.ops.append(("text", x, y, text, font, fill))
+
+    def divider(self, y, card_width):
+        self.ops.append(("divider", 0, y, card_width))
+
+    def replay(self, draw: ImageDraw.ImageDraw, dy: int = 0):
+        # 循环内频繁使用的方法与颜色绑定为局部变量
+        draw_text = draw.text
+        divider_color = COLORS["divider"]
+        for op in self.ops:
+            kind, x, y = op[0], op[1], op[2] + dy
+            if kind == "text":
+                draw_text((x, y), op[3], font=op[4], fill=op[5])
+            elif kind == "divider":
+                draw.line((PADDING, y, op[3] - PADDING, y), fill=divider_color, width=SCALE)
+
+
 class CardRenderer:
     # 类级别的字体缓存
     _font_cache: dict[tuple[str, int], ImageFont.FreeTypeFont] = {}
@@ -113,17 +222,37 @@ class CardRenderer:
     def __init__(self, plugin_dir: Path, session: aiohttp.ClientSession | None = None):
         self.plugin_dir = plugin_dir
         self._session = session
+        # 仅关闭由渲染器自己创建的会话，外部传入的会话由插件负责关闭
+        self._owns_session = False
         self.cache_dir = plugin_dir / "data" / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._font_path: Optional[str] = None
         self._find_font()
-        # 图片内存缓存（避免同一渲染周期重复加载）
-        self._img_memory_cache: dict[str, Image.Image] = {}
+        logger.debug(f"Pillow {PIL.__version__}{'（SIMD）' if PILLOW_SIMD else ''}")
+        # 预加载常用字号，首张卡片无需再解析字体文件
+        for size in PRELOAD_FONT_SIZES:
+            self._font(size)
+        # 已解码图片的 LRU 内存缓存，重复查询时跳过磁盘读取与解码
+        self._img_memory_cache: OrderedDict[str, Image.Image] = OrderedDict()
+        # 已缩放到 THUMB_SIZE 的缩略图（按 URL），重复渲染同一怪物/物品时跳过缩放
+        self._thumb_memory_cache: OrderedDict[str, Image.Image] = OrderedDict()
+        # 进行中的图片下载：URL -> 任务
+        self._inflight_fetches: dict[str, asyncio.Future] = {}
         self._cleanup_count = 0
+        # 换行结果缓存（测量与绘制阶段共用同一份结果）
+        self._wrap_cache: OrderedDict[tuple, tuple[str, ...]] = OrderedDict()
+        # 单字宽度表：字体 -> {字符: 前进宽度}
+        self._glyph_widths: dict[ImageFont.FreeTypeFont, dict[str, float]] = {}
+        # 短文本宽度缓存：(字体, 文本) -> 前进宽度
+        self._text_widths: dict[tuple[ImageFont.FreeTypeFont, str], float] = {}
+        # 短文本包围盒缓存：(字体, 文本) -> bbox，用于需要纵向尺寸的评级字母与百分比角标
+        self._text_bboxes: dict[tuple[ImageFont.FreeTypeFont, str], tuple[int, int, int, int]] = {}
+        # 预渲染的头部圆角底板：(模式, 宽, 高) -> 图片
+        self._header_templates: dict[tuple[str, int, int], Image.Image] = {}
 
     def _find_font(self):
         for p in FONT_PATHS:
-            if os.path.exists(p):
+            if Path(p).is_file():
                 self._font_path = p
                 logger.debug(f"使用字体: {p}")
                 return
@@ -133,9 +262,10 @@ class CardRenderer:
     def _font(self, size: int) -> ImageFont.FreeTypeFont:
         """获取字体对象，使用缓存避免重复加载"""
         cache_key = (self._font_path, size)
-        if cache_key in CardRenderer._font_cache:
-            return CardRenderer._font_cache[cache_key]
-        
+        font = CardRenderer._font_cache.get(cache_key)
+        if font is not None:
+            return font
+
         if self._font_path:
             font = ImageFont.truetype(self._font_path, size)
         else:
@@ -149,10 +279,18 @@ class CardRenderer:
             return self._session
         self._session = aiohttp.ClientSession(
             timeout=aiohttp.ClientTimeout(total=15),
-            connector=aiohttp.TCPConnector(limit=5, ttl_dns_cache=300)
+            connector=aiohttp.TCPConnector(limit=5, ttl_dns_cache=300, keepalive_timeout=60)
         )
+        self._owns_session = True
         return self._session
 
+    async def close(self):
+        """关闭渲染器自建的 HTTP 会话，在插件卸载时调用"""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._owns_session = False
+
     def _cleanup_image_cache(self, force: bool = False):
         """清理过期的图片缓存文件"""
         self._cleanup_count += 1
@@ -179,6 +317,15 @@ class CardRenderer:
                         removed += 1
                     except OSError:
                         pass
+
+            # 清理写入中途崩溃留下的临时文件；正在写入的临时文件很新，不会被误删
+            for f in self.cache_dir.glob("*.tmp"):
+                try:
+                    if now - f.stat().st_mtime > IMAGE_CACHE_TMP_MAX_AGE:
+                        f.unlink()
+                        removed += 1
+                except OSError:
+                    pass
             
             # 如果文件数超过限制，删除最老的
             remaining = list(self.cache_dir.glob("*.webp"))
@@ -200,22 +347,34 @@ class CardRenderer:
     async def _fetch_image(self, url: str) -> Optional[Image.Image]:
         """获取图片，优先使用内存缓存，然后磁盘缓存，最后网络请求"""
         # 内存缓存检查
-        if url in self._img_memory_cache:
-            return self._img_memory_cache[url]
-        
+        img = self._img_memory_cache.get(url)
+        if img is not None:
+            self._img_memory_cache.move_to_end(url)
+            return img
+
+        # 同一 URL 的并发请求共用一个下载任务，避免重复下载和同时写同一个缓存文件
+        task = self._inflight_fetches.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._load_image(url))
+            self._inflight_fetches[url] = task
+            task.add_done_callback(lambda _: self._inflight_fetches.pop(url, None))
+        # shield：某个等待方被取消时不影响其他等待同一任务的卡片
+        return await asyncio.shield(task)
+
+    async def _load_image(self, url: str) -> Optional[Image.Image]:
+        """从磁盘缓存或网络加载图片并存入内存缓存"""
         cache_name = hashlib.md5(url.encode()).hexdigest() + ".webp"
         cache_path = self.cache_dir / cache_name
 
-        # 磁盘缓存检查
-        if cache_path.exists():
-            try:
-                img = Image.open(cache_path).convert("RGBA")
-                # 存入内存缓存
-                if len(self._img_memory_cache) < 50:  # 限制内存缓存数量
-                    self._img_memory_cache[url] = img
-                return img
-            except Exception:
-                pass
+        # 磁盘缓存检查：直接尝试打开，省去一次 stat
+        try:
+            img = await asyncio.to_thread(self._decode_image, cache_path)
+            self._remember_image(url, img)
+            return img
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"图片缓存损坏，重新下载: {cache_path.name}: {e}")
 
         # 定期清理缓存
         self._cleanup_image_cache()
@@ -225,33 +384,133 @@ class CardRenderer:
             async with session.get(url) as resp:
                 if resp.status == 200:
                     data = await resp.read()
-                    with open(cache_path, "wb") as f:
-                        f.write(data)
-                    img = Image.open(io.BytesIO(data)).convert("RGBA")
-                    if len(self._img_memory_cache) < 50:
-                        self._img_memory_cache[url] = img
+                    # 写盘与解码放到工作线程，避免阻塞事件循环
+                    await asyncio.to_thread(self._write_cache_file, cache_path, data)
+                    img = await asyncio.to_thread(self._decode_image, io.BytesIO(data))
+                    self._remember_image(url, img)
                     return img
         except Exception as e:
             logger.debug(f"获取图片失败: {url}: {e}")
         return None
     
+    @staticmethod
+    def _write_cache_file(cache_path: Path, data: bytes):
+        """先写临时文件再原子替换，避免中途崩溃留下损坏的缓存文件"""
+        tmp = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(data)
+            os.replace(tmp, cache_path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _decode_image(source) -> Image.Image:
+        """解码为 RGBA；对支持 draft 的格式（JPEG）直接以缩小比例解码"""
+        img = Image.open(source)
+        img.draft("RGB", IMAGE_DRAFT_SIZE)
+        return img.convert("RGBA")
+
+    def _remember_image(self, url: str, img: Image.Image, cache: OrderedDict | None = None):
+        """存入内存缓存（默认为解码图片缓存），超出上限时淘汰最久未使用的图片"""
+        if cache is None:
+            cache = self._img_memory_cache
+        cache[url] = img
+        cache.move_to_end(url)
+        while len(cache) > IMAGE_MEMORY_CACHE_MAX_ITEMS:
+            cache.popitem(last=False)
+
+    async def _fetch_thumbnail(self, url: str, size: tuple[int, int] | None = None) -> Optional[Image.Image]:
+        """获取缩略图：默认等比缩放到 THUMB_SIZE 方框内，指定 size 时缩放到该尺寸
+
+        缩放在工作线程中进行，结果按 (URL, 尺寸) 缓存。
+        """
+        cache_key = url if size is None else f"{url}#{size[0]}x{size[1]}"
+        thumb = self._thumb_memory_cache.get(cache_key)
+        if thumb is not None:
+            self._thumb_memory_cache.move_to_end(cache_key)
+            return thumb
+        src = await self._fetch_image(url)
+        if src is None:
+            return None
+        if size is None:
+            thumb = await asyncio.to_thread(self._fit_thumbnail, src)
+        else:
+            thumb = await asyncio.to_thread(self._resize_thumbnail, src, size)
+        self._remember_image(cache_key, thumb, self._thumb_memory_cache)
+        return thumb
+
     def clear_memory_cache(self):
         """清理内存缓存，在渲染完成后调用"""
         self._img_memory_cache.clear()
+        self._thumb_memory_cache.clear()
+
+    async def _save_image(self, img: Image.Image, palette: bool = False) -> bytes:
+        """统一的图片保存方法；PNG 编码在工作线程中进行，不阻塞事件循环
 
-    def _save_image(self, img: Image.Image, optimize: bool = True) -> bytes:
-        """统一的图片保存方法，支持压缩优化"""
+        palette 仅用于不含缩略图的卡片，照片类内容量化后会出现色带。
+        """
+        return await asyncio.to_thread(self._encode_png, img, palette)
+
+    @staticmethod
+    def _encode_png(img: Image.Image, palette: bool = False) -> bytes:
+        """编码为 PNG；卡片即发即弃，默认使用快速压缩"""
         buf = io.BytesIO()
-        # 使用优化参数减少文件大小
-        save_kwargs = {"format": "PNG"}
-        if optimize:
-            save_kwargs["optimize"] = True
-            # compress_level 范围 0-9，值越大压缩越多但越慢
-            save_kwargs["compress_level"] = 6
-        img.save(buf, **save_kwargs)
+        if img.mode == "RGBA":
+            # 卡片背景不透明，去掉 alpha 通道可少编码四分之一数据
+            img = img.convert("RGB")
+        if palette:
+            # 文字卡片颜色很少，量化为调色板后每像素 1 字节
+            img = img.quantize(CARD_PALETTE_COLORS, method=Image.Quantize.FASTOCTREE)
+        # compress_level 范围 0-9，值越大压缩越多但越慢
+        img.save(buf, format="PNG", compress_level=CARD_PNG_COMPRESS_LEVEL)
         return buf.getvalue()
 
+    @staticmethod
+    def _resize_thumbnail(src: Image.Image, size: tuple[int, int]) -> Image.Image:
+        """缩放缩略图：尺寸相同直接返回，缩小用 BOX 面积平均，放大用 BILINEAR"""
+        if src.size == size:
+            return src
+        if size[0] <= src.width and size[1] <= src.height:
+            return src.resize(size, THUMBNAIL_FILTER)
+        return src.resize(size, Image.BILINEAR)
+
+    def _fit_thumbnail(self, src: Image.Image) -> Image.Image:
+        """等比缩放到 THUMB_SIZE 方框内"""
+        orig_w, orig_h = src.size
+        ratio = min(THUMB_SIZE / orig_w, THUMB_SIZE / orig_h)
+        new_w = max(1, int(orig_w * ratio))
+        new_h = max(1, int(orig_h * ratio))
+        return self._resize_thumbnail(src, (new_w, new_h))
+
+    def _text_width(self, font: ImageFont.FreeTypeFont, text: str) -> float:
+        """测量单行文本宽度；徽章、标签等文本反复出现，按 (字体, 文本) 缓存"""
+        key = (font, text)
+        width = self._text_widths.get(key)
+        if width is None:
+            if len(self._text_widths) >= TEXT_WIDTH_CACHE_MAX_ENTRIES:
+                self._text_widths.clear()
+            width = self._text_widths[key] = font.getlength(text)
+        return width
+
+    def _text_bbox(self, font: ImageFont.FreeTypeFont, text: str) -> tuple[int, int, int, int]:
+        """测量单行文本包围盒，按 (字体, 文本) 缓存；取值很少的角标文本只测一次"""
+        key = (font, text)
+        bbox = self._text_bboxes.get(key)
+        if bbox is None:
+            if len(self._text_bboxes) >= TEXT_WIDTH_CACHE_MAX_ENTRIES:
+                self._text_bboxes.clear()
+            bbox = self._text_bboxes[key] = font.getbbox(text)
+        return bbox
+
     def _wrap_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> list:
+        """按宽度换行，结果按 (文本, 字体, 宽度) 做 LRU 缓存"""
+        cache_key = (text, font, max_width)
+        cached = self._wrap_cache.get(cache_key)
+        if cached is not None:
+            self._wrap_cache.move_to_end(cache_key)
+            return list(cached)
+
         lines = []
         for paragraph in text.split("\n"):
             if not paragraph.strip():
@@ -259,37 +518,86 @@ class CardRenderer:
                 continue
             has_cjk = bool(_CJK_RANGES.search(paragraph))
             if has_cjk:
-                current = ""
-                for char in paragraph:
-                    test = current + char
-                    bbox = font.getbbox(test)
-                    w = bbox[2] - bbox[0]
-                    if w > max_width and current:
-                        lines.append(current)
-                        current = char
-                    else:
-                        current = test
-                if current:
-                    lines.append(current)
+                lines.extend(self._wrap_units(list(paragraph), "", font, max_width))
             else:
-                words = paragraph.split(" ")
-                current = ""
-                for word in words:
-                    test = f"{current} {word}" if current else word
-                    bbox = font.getbbox(test)
-                    w = bbox[2] - bbox[0]
-                    if w > max_width and current:
-                        lines.append(current)
-                        current = word
-                    else:
-                        current = test
-                if current:
-                    lines.append(current)
+                # 与逐词贪心一致：段首的空格不保留，行内连续空格原样保留
+                lines.extend(self._wrap_units(paragraph.lstrip(" ").split(" "), " ", font, max_width))
+
+        self._wrap_cache[cache_key] = tuple(lines)
+        if len(self._wrap_cache) > WRAP_CACHE_MAX_ENTRIES:
+            self._wrap_cache.popitem(last=False)
+        return lines
+
+    def _wrap_units(self, units: list, sep: str, font: ImageFont.FreeTypeFont, max_width: int) -> list:
+        """估算 + 二分的贪心换行：先按单元宽度估算每行能放下的单元数，再二分查找恰好放下的位置
+
+        units 为字符（CJK）或单词（西文），每行至少放一个单元；
+        西文行首的空单元（连续空格）跳过，不让新行以空格开头。
+        """
+        getlength = font.getlength
+        text = sep.join(units)
+        total_w = getlength(text)
+        if total_w <= max_width:
+            return [text]
+        # 查单字宽度表估算（表按字体累积，常用字只测一次）；西文单词取各字宽之和
+        # 分隔符单独入表：只有一个超宽单词的段落里并不含空格
+        char_w = self._glyph_widths.setdefault(font, {})
+        for c in set(text).union(sep).difference(char_w):
+            char_w[c] = getlength(c)
+        if sep:
+            widths = [sum(map(char_w.__getitem__, u)) for u in units]
+            sep_w = sum(map(char_w.__getitem__, sep))
+        else:
+            widths = [char_w[c] for c in units]
+            sep_w = 0.0
+
+        # 前缀和：cum[k] 为前 k 个单元（各自带一个分隔符）的宽度，估算行尾只需一次二分
+        cum = [0.0, *accumulate(w + sep_w for w in widths)]
+        lines = []
+        start = 0
+        n = len(units)
+        while start < n:
+            if sep and not units[start]:
+                start += 1
+                continue
+            guess = bisect_right(cum, cum[start] + max_width + sep_w, start) - 1
+            # 行尾位于 [lo, hi]，lo 总是可行（每行至少一个单元）
+            lo, hi = start + 1, n
+            # 先验证估算位置，估算准确时只需两次测量
+            if guess > lo:
+                if getlength(sep.join(units[start:guess])) <= max_width:
+                    lo = guess
+                else:
+                    hi = guess - 1
+            if lo == guess and lo < hi:
+                if getlength(sep.join(units[start:lo + 1])) > max_width:
+                    hi = lo
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if getlength(sep.join(units[start:mid])) <= max_width:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            lines.append(sep.join(units[start:lo]))
+            start = lo
         return lines
 
     def _draw_rounded_rect(self, draw: ImageDraw.ImageDraw, xy, radius, fill):
         draw.rounded_rectangle(xy, radius=radius, fill=fill)
 
+    def _paste_header(self, img: Image.Image, width: int, height: int):
+        """贴上头部圆角底板；同尺寸的底板只绘制一次，之后直接整块复制"""
+        key = (img.mode, width, height)
+        template = self._header_templates.get(key)
+        if template is None:
+            if len(self._header_templates) >= HEADER_TEMPLATE_MAX_ITEMS:
+                self._header_templates.clear()
+            # rounded_rectangle 的右下角坐标是包含在内的，底板需多留一行
+            template = Image.new(img.mode, (width, height + 1), COLORS["bg"])
+            self._draw_rounded_rect(ImageDraw.Draw(template), (0, 0, width, height), HEADER_RADIUS, COLORS["header_bg"])
+            self._header_templates[key] = template
+        img.paste(template, (0, 0))
+
     def _draw_divider(self, draw, y, card_width):
         draw.line((PADDING, y, card_width - PADDING, y), fill=COLORS["divider"], width=SCALE)
 
@@ -306,14 +614,14 @@ class CardRenderer:
                 continue
             color = emphasis_color if is_em else normal_color
             draw.text((cursor_x, y), segment, font=font, fill=color)
-            bbox = font.getbbox(segment)
-            cursor_x += max(0, bbox[2] - bbox[0])
+            cursor_x += font.getlength(segment)
 
     def _draw_tier_badge(self, draw, tier_raw, tier_clean, y, card_width, font_tag):
         tier_color = TIER_COLORS.get(tier_clean, COLORS["text_dim"])
         tier_badge = f" {tier_raw} "
-        bbox = font_tag.getbbox(tier_badge)
-        tw = bbox[2] - bbox[0] + 12 * SCALE
+        # 按带空格的标签量宽度，两侧空格撑出徽章的左右留白
+        badge_bbox = self._text_bbox(font_tag, tier_badge)
+        tw = badge_bbox[2] - badge_bbox[0] + 12 * SCALE
         badge_x = card_width - PADDING - tw
         draw.rounded_rectangle(
             (badge_x, y + SECTION_GAP, badge_x + tw, y + 28 * SCALE), radius=BADGE_RADIUS, fill=tier_color
@@ -323,7 +631,8 @@ class CardRenderer:
             fill=COLORS["bg"] if tier_clean in ("Gold", "Diamond") else COLORS["text"]
         )
 
-    async def render_monster_card(self, key: str, monster: dict) -> bytes:
+    async def render_monster_card(self, key: str, monster: dict) -> tuple[bytes, bool]:
+        """渲染怪物卡片，返回 (PNG, 是否画上了头部图片)"""
         name_zh = monster.get("name_zh", key)
         name_en = monster.get("name", "")
 
@@ -335,144 +644,66 @@ class CardRenderer:
 
         content_width = CARD_WIDTH - PADDING * 2
 
-        sections = []
-
-        monster_img = await self._fetch_image(
+        # 先发出图片请求，排版正文期间网络在后台等待，头部高度在取回图片后再确定
+        img_task = asyncio.ensure_future(self._fetch_thumbnail(
             f"{GITHUB_RAW}/assets/monsters/characters/{name_zh}.webp"
-        )
-
-        header_height = 80 * SCALE if not monster_img else 120 * SCALE
-        sections.append(("header", header_height))
-
-        info_lines = []
-        if monster.get("available"):
-            info_lines.append(f"出现: {monster['available']}")
-        if monster.get("health"):
-            info_lines.append(f"生命值: {monster['health']}")
-        if monster.get("level"):
-            info_lines.append(f"等级: {monster['level']}")
-        if monster.get("combat"):
-            c = monster["combat"]
-            parts = []
-            if c.get("gold"):
-                parts.append(c["gold"])
-            if c.get("exp"):
-                parts.append(c["exp"])
-            if parts:
-                info_lines.append(f"奖励: {' | '.join(parts)}")
-        if info_lines:
-            sections.append(("info", PADDING + len(info_lines) * LINE_HEIGHT_DETAIL))
-
-        skills = monster.get("skills", [])
-        if skills:
-            skill_height = 30
-            for s in skills[:6]:
-                skill_height += LINE_HEIGHT_SKILL
-                tiers = s.get("tiers", {})
-                if tiers:
-                    current = s.get("current_tier", "").lower()
-                    tier_data = tiers.get(current) or next(
-                        (v for v in tiers.values() if v), None
-                    )
-                    if tier_data and tier_data.get("description"):
-                        for desc in tier_data["description"][:2]:
-                            wrapped = self._wrap_text(desc, font_small, content_width - INDENT_DEEP - INDENT)
-                            skill_height += len(wrapped) * LINE_HEIGHT_SMALL
-                        skill_height += DESC_GAP
-            sections.append(("skills", skill_height))
-
-        items = monster.get("items", [])
-        if items:
-            seen = set()
-            unique_items = []
-            for it in items:
-                iid = it.get("id", it.get("name", ""))
-                if iid not in seen:
-                    seen.add(iid)
-                    unique_items.append(it)
-            item_height = 30
-            for it in unique_items[:6]:
-                item_height += LINE_HEIGHT_ITEM
-                tiers = it.get("tiers", {})
-                if tiers:
-                    current = it.get("current_tier", "").lower()
-                    tier_data = tiers.get(current) or next(
-                        (v for v in tiers.values() if v), None
-                    )
-                    if tier_data and tier_data.get("description"):
-                        desc = tier_data["description"][0]
-                        wrapped = self._wrap_text(desc, font_small, content_width - INDENT_DEEP - INDENT)
-                        item_height += len(wrapped) * LINE_HEIGHT_SMALL
-                        item_height += DESC_GAP
-            if len(unique_items) > 6:
-                item_height += LINE_HEIGHT_DETAIL
-            sections.append(("items", item_height))
-
-        total_height = sum(h for _, h in sections) + PADDING * 2 + (len(sections) - 1) * SECTION_GAP + PADDING
-        img = Image.new("RGBA", (CARD_WIDTH, total_height), COLORS["bg"])
-        draw = ImageDraw.Draw(img)
-
-        y = PADDING
-
-        self._draw_rounded_rect(draw, (0, 0, CARD_WIDTH, header_height + PADDING), HEADER_RADIUS, COLORS["header_bg"])
-
-        if monster_img:
-            orig_w, orig_h = monster_img.size
-            ratio = min(THUMB_SIZE / orig_w, THUMB_SIZE / orig_h)
-            new_w = max(1, int(orig_w * ratio))
-            new_h = max(1, int(orig_h * ratio))
-            thumb = monster_img.resize((new_w, new_h), Image.LANCZOS)
-            thumb_y = y + 8 * SCALE + (THUMB_SIZE - new_h) // 2
-            thumb_x = PADDING + (THUMB_SIZE - new_w) // 2
-            img.paste(thumb, (thumb_x, thumb_y), thumb)
-            text_x = PADDING + THUMB_MARGIN
-        else:
-            text_x = PADDING
-
-        draw.text((text_x, y + 12 * SCALE), name_zh, font=font_title, fill=COLORS["text"])
-        draw.text((text_x, y + 46 * SCALE), name_en, font=font_subtitle, fill=COLORS["text_dim"])
-
-        tags = monster.get("tags", [])
-        if isinstance(tags, list) and tags:
-            tag_x = text_x
-            for tag in tags[:4]:
-                bbox = font_tag.getbbox(tag)
-                tw = bbox[2] - bbox[0] + 12 * SCALE
-                if tag_x + tw > CARD_WIDTH - PADDING:
-                    break
-                draw.rounded_rectangle(
-                    (tag_x, y + 64 * SCALE, tag_x + tw, y + 82 * SCALE), radius=TAG_RADIUS, fill=COLORS["divider"]
-                )
-                draw.text((tag_x + 6 * SCALE, y + 65 * SCALE), tag, font=font_tag, fill=COLORS["accent"])
-                tag_x += tw + 6 * SCALE
-
-        y = header_height + PADDING + SECTION_GAP
+        ))
+        try:
+            await asyncio.sleep(0)
+
+            info_lines = []
+            if monster.get("available"):
+                info_lines.append(f"出现: {monster['available']}")
+            if monster.get("health"):
+                info_lines.append(f"生命值: {monster['health']}")
+            if monster.get("level"):
+                info_lines.append(f"等级: {monster['level']}")
+            if monster.get("combat"):
+                c = monster["combat"]
+                parts = []
+                if c.get("gold"):
+                    parts.append(c["gold"])
+                if c.get("exp"):
+                    parts.append(c["exp"])
+                if parts:
+                    info_lines.append(f"奖励: {' | '.join(parts)}")
+
+            skills = monster.get("skills", [])
+            items = monster.get("items", [])
+            # 同一物品可能在多个品质下重复出现；插件加载数据时已按 id 去重
+            unique_items = monster.get("_unique_items")
+            if unique_items is None:
+                seen = set()
+                unique_items = []
+                for it in items:
+                    iid = it.get("id", it.get("name", ""))
+                    if iid not in seen:
+                        seen.add(iid)
+                        unique_items.append(it)
 
-        for section_name, section_height in sections:
-            if section_name == "header":
-                continue
+            # 布局：单次遍历计算位置并记录绘制指令（y 相对正文起点）
+            ops = _DrawOps()
+            y = 0
 
-            if section_name == "info":
+            if info_lines:
                 for line in info_lines:
-                    draw.text((PADDING, y), line, font=font_body, fill=COLORS["text_dim"])
+                    ops.text(PADDING, y, line, font_body, COLORS["text_dim"])
                     y += LINE_HEIGHT_DETAIL
-                self._draw_divider(draw, y, CARD_WIDTH)
+                ops.divider(y, CARD_WIDTH)
                 y += SECTION_GAP
 
-            elif section_name == "skills":
-                draw.text((PADDING, y), "【技能】", font=font_subtitle, fill=COLORS["accent"])
+            if skills:
+                ops.text(PADDING, y, "【技能】", font_subtitle, COLORS["accent"])
                 y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
                 for s in skills[:6]:
                     name = s.get("name", s.get("name_en", ""))
                     tier_str = s.get("tier", s.get("current_tier", ""))
-                    tier_clean = _clean_tier(tier_str)
-                    tier_color = TIER_COLORS.get(tier_clean, COLORS["text_dim"])
-                    draw.text((PADDING + 8 * SCALE, y), f"● {name}", font=font_body, fill=tier_color)
-                    bbox = font_body.getbbox(f"● {name}")
-                    name_w = bbox[2] - bbox[0]
-                    draw.text(
-                        (PADDING + 8 * SCALE + name_w + 8 * SCALE, y + 2 * SCALE), f"[{tier_str}]",
-                        font=font_small, fill=COLORS["text_dim"]
+                    tier_color = _tier_color(tier_str)
+                    ops.text(PADDING + 8 * SCALE, y, f"● {name}", font_body, tier_color)
+                    name_w = int(font_body.getlength(f"● {name}"))
+                    ops.text(
+                        PADDING + 8 * SCALE + name_w + 8 * SCALE, y + 2 * SCALE, f"[{tier_str}]",
+                        font_small, COLORS["text_dim"]
                     )
                     y += LINE_HEIGHT_SKILL
                     tiers = s.get("tiers", {})
@@ -484,41 +715,24 @@ class CardRenderer:
                         if tier_data and tier_data.get("description"):
                             for desc in tier_data["description"][:2]:
                                 for wl in self._wrap_text(desc, font_small, content_width - INDENT_DEEP - INDENT):
-                                    draw.text((PADDING + INDENT_DEEP, y), wl, font=font_small, fill=COLORS["text_dim"])
+                                    ops.text(PADDING + INDENT_DEEP, y, wl, font_small, COLORS["text_dim"])
                                     y += LINE_HEIGHT_SMALL
                             y += DESC_GAP
-                self._draw_divider(draw, y, CARD_WIDTH)
+                ops.divider(y, CARD_WIDTH)
                 y += SECTION_GAP
 
-            elif section_name == "items":
-                draw.text((PADDING, y), "【物品】", font=font_subtitle, fill=COLORS["green"])
+            if unique_items:
+                ops.text(PADDING, y, "【物品】", font_subtitle, COLORS["green"])
                 y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
-                seen2 = set()
-                count = 0
-                for it in items:
-                    iid = it.get("id", it.get("name", ""))
-                    if iid in seen2:
-                        continue
-                    seen2.add(iid)
-                    count += 1
-                    if count > 6:
-                        remaining = len(set(i.get("id", i.get("name", "")) for i in items)) - 6
-                        draw.text(
-                            (PADDING + 8 * SCALE, y), f"... 还有{remaining}个物品",
-                            font=font_small, fill=COLORS["text_dim"]
-                        )
-                        y += LINE_HEIGHT_DETAIL
-                        break
+                for it in unique_items[:6]:
                     name = it.get("name", "")
                     tier_str = it.get("tier", it.get("current_tier", ""))
-                    tier_clean = _clean_tier(tier_str)
-                    tier_color = TIER_COLORS.get(tier_clean, COLORS["text_dim"])
-                    draw.text((PADDING + 8 * SCALE, y), f"● {name}", font=font_body, fill=tier_color)
-                    bbox = font_body.getbbox(f"● {name}")
-                    name_w = bbox[2] - bbox[0]
-                    draw.text(
-                        (PADDING + 8 * SCALE + name_w + 8 * SCALE, y + 2 * SCALE), f"[{tier_str}]",
-                        font=font_small, fill=COLORS["text_dim"]
+                    tier_color = _tier_color(tier_str)
+                    ops.text(PADDING + 8 * SCALE, y, f"● {name}", font_body, tier_color)
+                    name_w = int(font_body.getlength(f"● {name}"))
+                    ops.text(
+                        PADDING + 8 * SCALE + name_w + 8 * SCALE, y + 2 * SCALE, f"[{tier_str}]",
+                        font_small, COLORS["text_dim"]
                     )
                     y += LINE_HEIGHT_ITEM
                     tiers_data = it.get("tiers", {})
@@ -530,13 +744,63 @@ class CardRenderer:
                         if tier_data and tier_data.get("description"):
                             desc = tier_data["description"][0]
                             for wl in self._wrap_text(desc, font_small, content_width - INDENT_DEEP - INDENT):
-                                draw.text((PADDING + INDENT_DEEP, y), wl, font=font_small, fill=COLORS["text_dim"])
+                                ops.text(PADDING + INDENT_DEEP, y, wl, font_small, COLORS["text_dim"])
                                 y += LINE_HEIGHT_SMALL
                             y += DESC_GAP
+                if len(unique_items) > 6:
+                    ops.text(
+                        PADDING + 8 * SCALE, y, f"... 还有{len(unique_items) - 6}个物品",
+                        font_small, COLORS["text_dim"]
+                    )
+                    y += LINE_HEIGHT_DETAIL
+
+            thumb = await img_task
+        finally:
+            # 排版出错时取消取图任务，不留下无人等待的任务；已完成时为空操作
+            img_task.cancel()
+
+        header_height = 80 * SCALE if not thumb else 120 * SCALE
+
+        body_top = header_height + PADDING + SECTION_GAP
+        total_height = body_top + y + PADDING * 2
+        img = Image.new("RGB", (CARD_WIDTH, total_height), COLORS["bg"])
+        draw = ImageDraw.Draw(img)
+
+        y = PADDING
 
-        return self._save_image(img)
+        self._paste_header(img, CARD_WIDTH, header_height + PADDING)
 
-    async def render_item_card(self, item: dict) -> bytes:
+        if thumb:
+            new_w, new_h = thumb.size
+            thumb_y = y + 8 * SCALE + (THUMB_SIZE - new_h) // 2
+            thumb_x = PADDING + (THUMB_SIZE - new_w) // 2
+            img.paste(thumb, (thumb_x, thumb_y), thumb)
+            text_x = PADDING + THUMB_MARGIN
+        else:
+            text_x = PADDING
+
+        draw.text((text_x, y + 12 * SCALE), name_zh, font=font_title, fill=COLORS["text"])
+        draw.text((text_x, y + 46 * SCALE), name_en, font=font_subtitle, fill=COLORS["text_dim"])
+
+        tags = monster.get("tags", [])
+        if isinstance(tags, list) and tags:
+            tag_x = text_x
+            for tag in tags[:4]:
+                tw = int(self._text_width(font_tag, tag)) + 12 * SCALE
+                if tag_x + tw > CARD_WIDTH - PADDING:
+                    break
+                draw.rounded_rectangle(
+                    (tag_x, y + 64 * SCALE, tag_x + tw, y + 82 * SCALE), radius=TAG_RADIUS, fill=COLORS["divider"]
+                )
+                draw.text((tag_x + 6 * SCALE, y + 65 * SCALE), tag, font=font_tag, fill=COLORS["accent"])
+                tag_x += tw + 6 * SCALE
+
+        ops.replay(draw, body_top)
+
+        return await self._save_image(img), thumb is not None
+
+    async def render_item_card(self, item: dict) -> tuple[bytes, bool]:
+        """渲染物品卡片，返回 (PNG, 是否画上了头部图片)"""
         name_cn = item.get("name_cn", "")
         name_en = item.get("name_en", "")
         tier_raw = item.get("starting_tier", "")
@@ -550,115 +814,148 @@ class CardRenderer:
 
         content_width = CARD_WIDTH - PADDING * 2
 
-        item_img = await self._fetch_image(
+        # 先发出图片请求，排版正文期间网络在后台等待
+        img_task = asyncio.ensure_future(self._fetch_thumbnail(
             f"{GITHUB_RAW}/images/{item.get('id', '')}.webp"
-        )
+        ))
+        try:
+            await asyncio.sleep(0)
+
+            header_h = 110 * SCALE
+
+            active_skills = item.get("skills", [])
+            passive_skills = item.get("skills_passive", [])
+
+            details = []
+            hero_str = item.get("heroes", "")
+            if hero_str:
+                details.append(f"英雄: {hero_str}")
+            if item.get("tags"):
+                details.append(f"标签: {item['tags']}")
+            size_str = item.get("size", "")
+            if size_str:
+                details.append(f"尺寸: {size_str}")
+            cd = item.get("cooldown")
+            if cd is not None:
+                details.append(f"冷却: {'被动' if cd == 0 else f'{cd}秒'}")
+            if item.get("available_tiers"):
+                details.append(f"品质: {item['available_tiers']}")
+
+            stats = []
+            if not _STAT_KEYS.isdisjoint(item.keys()):
+                for val_key, (tier_key, label) in _STAT_META.items():
+                    val = item.get(val_key)
+                    if val and val != 0:
+                        stats.append((label, val, item.get(tier_key, "")))
+
+            enchantments = item.get("enchantments", {})
+            ench_list = []
+            if enchantments and isinstance(enchantments, dict):
+                ench_list = list(enchantments.items())
+
+            quests = item.get("quests") or []
+            if quests and not isinstance(quests, list):
+                quests = [quests]
+
+            # 布局：单次遍历计算位置并记录绘制指令（y 相对正文起点）
+            ops = _DrawOps()
+            y = 0
+
+            if active_skills:
+                ops.text(PADDING, y, "【主动技能】", font_subtitle, COLORS["accent"])
+                y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
+                for sk in active_skills[:4]:
+                    txt = _get_skill_text(sk)
+                    for wl in self._wrap_text(txt, font_small, content_width - INDENT_DEEP):
+                        ops.text(PADDING + INDENT, y, wl, font_small, COLORS["text"])
+                        y += LINE_HEIGHT_SMALL
+                    y += SKILL_DESC_GAP
 
-        sections_height = 0
-
-        header_h = 110 * SCALE
-        sections_height += header_h
-
-        active_skills = item.get("skills", [])
-        passive_skills = item.get("skills_passive", [])
-        skills_h = 0
-        if active_skills:
-            skills_h += LINE_HEIGHT_SUBTITLE + SECTION_GAP
-            for sk in active_skills[:4]:
-                txt = _get_skill_text(sk)
-                wrapped = self._wrap_text(txt, font_small, content_width - INDENT_DEEP)
-                skills_h += len(wrapped) * LINE_HEIGHT_SMALL + SKILL_DESC_GAP
-        if passive_skills:
-            skills_h += LINE_HEIGHT_SUBTITLE + SECTION_GAP
-            for sk in passive_skills[:4]:
-                txt = _get_skill_text(sk)
-                wrapped = self._wrap_text(txt, font_small, content_width - INDENT_DEEP)
-                skills_h += len(wrapped) * LINE_HEIGHT_SMALL + SKILL_DESC_GAP
-        if skills_h:
-            sections_height += skills_h + SECTION_GAP
+            if passive_skills:
+                ops.text(PADDING, y, "【被动技能】", font_subtitle, COLORS["purple"])
+                y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
+                for sk in passive_skills[:4]:
+                    txt = _get_skill_text(sk)
+                    for wl in self._wrap_text(txt, font_small, content_width - INDENT_DEEP):
+                        ops.text(PADDING + INDENT, y, wl, font_small, COLORS["text"])
+                        y += LINE_HEIGHT_SMALL
+                    y += SKILL_DESC_GAP
 
-        details = []
-        hero_str = item.get("heroes", "")
-        if hero_str:
-            details.append(f"英雄: {hero_str}")
-        if item.get("tags"):
-            details.append(f"标签: {item['tags']}")
-        size_str = item.get("size", "")
-        if size_str:
-            details.append(f"尺寸: {size_str}")
-        cd = item.get("cooldown")
-        if cd is not None:
-            details.append(f"冷却: {'被动' if cd == 0 else f'{cd}秒'}")
-        if item.get("available_tiers"):
-            details.append(f"品质: {item['available_tiers']}")
-        if details:
-            sections_height += len(details) * LINE_HEIGHT_DETAIL + SECTION_GAP
-
-        stat_fields = [
-            ("damage", "damage_tiers", "伤害"),
-            ("heal", "heal_tiers", "治疗"),
-            ("shield", "shield_tiers", "护盾"),
-            ("burn", "burn_tiers", "灼烧"),
-            ("poison", "poison_tiers", "中毒"),
-            ("regen", "regen_tiers", "再生"),
-            ("lifesteal", "lifesteal_tiers", "吸血"),
-            ("ammo", "ammo_tiers", "弹药"),
-            ("crit", "crit_tiers", "暴击"),
-            ("multicast", "multicast_tiers", "多重触发"),
-        ]
-        stats = []
-        for val_key, tier_key, label in stat_fields:
-            val = item.get(val_key)
-            tiers_str = item.get(tier_key, "")
-            if val and val != 0:
-                stats.append((label, val, tiers_str))
-        if stats:
-            sections_height += LINE_HEIGHT_SUBTITLE + SECTION_GAP + len(stats) * LINE_HEIGHT_STAT + SECTION_GAP
-
-        enchantments = item.get("enchantments", {})
-        ench_list = []
-        if enchantments and isinstance(enchantments, dict):
-            ench_list = list(enchantments.items())
-            ench_h = LINE_HEIGHT_SUBTITLE + SECTION_GAP
-            for ench_key, ench_data in ench_list:
-                if isinstance(ench_data, dict):
-                    effect = ench_data.get("effect_cn", ench_data.get("effect_en", ""))
-                    wrapped = self._wrap_text(effect, font_small, content_width - INDENT_DEEP)
-                    ench_h += PADDING + len(wrapped) * LINE_HEIGHT_SMALL
-            sections_height += ench_h + SECTION_GAP
-
-        quests = item.get("quests") or []
-        if quests and not isinstance(quests, list):
-            quests = [quests]
-        quests_h = 0
-        if quests:
-            quests_h = LINE_HEIGHT_SUBTITLE + SECTION_GAP
-            for q in quests:
-                target = q.get("cn_target") or q.get("en_target", "")
-                reward = q.get("cn_reward") or q.get("en_reward", "")
-                if target:
-                    wrapped_t = self._wrap_text(f"→ {target}", font_small, content_width - INDENT_DEEP)
-                    quests_h += len(wrapped_t) * LINE_HEIGHT_SMALL
-                if reward:
-                    wrapped_r = self._wrap_text(f"=> {reward}", font_small, content_width - INDENT_DEEP)
-                    quests_h += len(wrapped_r) * LINE_HEIGHT_SMALL
-                quests_h += SKILL_DESC_GAP
-            sections_height += quests_h + SECTION_GAP
-
-        total_height = sections_height + PADDING * 2 + PADDING
-        img = Image.new("RGBA", (CARD_WIDTH, total_height), COLORS["bg"])
+            if active_skills or passive_skills:
+                ops.divider(y, CARD_WIDTH)
+                y += SECTION_GAP
+
+            if details:
+                for line in details:
+                    ops.text(PADDING, y, line, font_small, COLORS["text_dim"])
+                    y += LINE_HEIGHT_DETAIL
+                ops.divider(y, CARD_WIDTH)
+                y += SECTION_GAP
+
+            if stats:
+                ops.text(PADDING, y, "【数值】", font_subtitle, COLORS["orange"])
+                y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
+                for label, val, tiers_str in stats:
+                    val_text = f"{label}: {val}"
+                    ops.text(PADDING + INDENT, y, val_text, font_body, COLORS["text"])
+                    if tiers_str:
+                        vw = int(self._text_width(font_body, val_text))
+                        ops.text(
+                            PADDING + INDENT + vw + 8 * SCALE, y + 2 * SCALE, f"({tiers_str})",
+                            font_small, COLORS["text_dim"]
+                        )
+                    y += LINE_HEIGHT_STAT
+                ops.divider(y, CARD_WIDTH)
+                y += SECTION_GAP
+
+            if ench_list:
+                ops.text(PADDING, y, f"【附魔】({len(enchantments)}种)", font_subtitle, COLORS["pink"])
+                y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
+                for ench_key, ench_data in ench_list:
+                    if isinstance(ench_data, dict):
+                        ench_cn = ench_data.get("name_cn", ench_key)
+                        ops.text(PADDING + INDENT, y, f"● {ench_cn}({ench_key})", font_body, COLORS["gold"])
+                        y += PADDING
+                        effect = ench_data.get("effect_cn", ench_data.get("effect_en", ""))
+                        for wl in self._wrap_text(effect, font_small, content_width - INDENT_DEEP):
+                            ops.text(PADDING + INDENT_DEEP + 2 * SCALE, y, wl, font_small, COLORS["text_dim"])
+                            y += LINE_HEIGHT_SMALL
+                if quests:
+                    ops.divider(y + SECTION_GAP, CARD_WIDTH)
+                    y += SECTION_GAP * 2
+
+            if quests:
+                ops.text(PADDING, y, f"【任务】({len(quests)}个)", font_subtitle, COLORS["green"])
+                y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
+                for q in quests:
+                    target = q.get("cn_target") or q.get("en_target", "")
+                    reward = q.get("cn_reward") or q.get("en_reward", "")
+                    if target:
+                        for wl in self._wrap_text(f"→ {target}", font_small, content_width - INDENT_DEEP):
+                            ops.text(PADDING + INDENT, y, wl, font_small, COLORS["text_dim"])
+                            y += LINE_HEIGHT_SMALL
+                    if reward:
+                        for wl in self._wrap_text(f"=> {reward}", font_small, content_width - INDENT_DEEP):
+                            ops.text(PADDING + INDENT, y, wl, font_small, COLORS["accent"])
+                            y += LINE_HEIGHT_SMALL
+                    y += SKILL_DESC_GAP
+
+            thumb = await img_task
+        finally:
+            # 排版出错时取消取图任务，不留下无人等待的任务；已完成时为空操作
+            img_task.cancel()
+
+        body_top = header_h + PADDING + SECTION_GAP
+        total_height = body_top + y + PADDING * 2
+        img = Image.new("RGB", (CARD_WIDTH, total_height), COLORS["bg"])
         draw = ImageDraw.Draw(img)
 
         y = PADDING
 
-        self._draw_rounded_rect(draw, (0, 0, CARD_WIDTH, header_h + PADDING), HEADER_RADIUS, COLORS["header_bg"])
+        self._paste_header(img, CARD_WIDTH, header_h + PADDING)
 
-        if item_img:
-            orig_w, orig_h = item_img.size
-            ratio = min(THUMB_SIZE / orig_w, THUMB_SIZE / orig_h)
-            new_w = max(1, int(orig_w * ratio))
-            new_h = max(1, int(orig_h * ratio))
-            thumb = item_img.resize((new_w, new_h), Image.LANCZOS)
+        if thumb:
+            new_w, new_h = thumb.size
             thumb_y = y + 8 * SCALE + (THUMB_SIZE - new_h) // 2
             thumb_x = PADDING + (THUMB_SIZE - new_w) // 2
             img.paste(thumb, (thumb_x, thumb_y), thumb)
@@ -671,89 +968,9 @@ class CardRenderer:
 
         self._draw_tier_badge(draw, tier_raw, tier_clean, y, CARD_WIDTH, font_tag)
 
-        y = header_h + PADDING + SECTION_GAP
-
-        if active_skills:
-            draw.text((PADDING, y), "【主动技能】", font=font_subtitle, fill=COLORS["accent"])
-            y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
-            for sk in active_skills[:4]:
-                txt = _get_skill_text(sk)
-                for wl in self._wrap_text(txt, font_small, content_width - INDENT_DEEP):
-                    draw.text((PADDING + INDENT, y), wl, font=font_small, fill=COLORS["text"])
-                    y += LINE_HEIGHT_SMALL
-                y += SKILL_DESC_GAP
-
-        if passive_skills:
-            draw.text((PADDING, y), "【被动技能】", font=font_subtitle, fill=COLORS["purple"])
-            y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
-            for sk in passive_skills[:4]:
-                txt = _get_skill_text(sk)
-                for wl in self._wrap_text(txt, font_small, content_width - INDENT_DEEP):
-                    draw.text((PADDING + INDENT, y), wl, font=font_small, fill=COLORS["text"])
-                    y += LINE_HEIGHT_SMALL
-                y += SKILL_DESC_GAP
-
-        if active_skills or passive_skills:
-            self._draw_divider(draw, y, CARD_WIDTH)
-            y += SECTION_GAP
-
-        if details:
-            for d in details:
-                draw.text((PADDING, y), d, font=font_small, fill=COLORS["text_dim"])
-                y += LINE_HEIGHT_DETAIL
-            self._draw_divider(draw, y, CARD_WIDTH)
-            y += SECTION_GAP
-
-        if stats:
-            draw.text((PADDING, y), "【数值】", font=font_subtitle, fill=COLORS["orange"])
-            y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
-            for label, val, tiers_str in stats:
-                val_text = f"{label}: {val}"
-                draw.text((PADDING + INDENT, y), val_text, font=font_body, fill=COLORS["text"])
-                if tiers_str:
-                    bbox = font_body.getbbox(val_text)
-                    vw = bbox[2] - bbox[0]
-                    draw.text(
-                        (PADDING + INDENT + vw + 8 * SCALE, y + 2 * SCALE), f"({tiers_str})",
-                        font=font_small, fill=COLORS["text_dim"]
-                    )
-                y += LINE_HEIGHT_STAT
-            self._draw_divider(draw, y, CARD_WIDTH)
-            y += SECTION_GAP
-
-        if ench_list:
-            draw.text((PADDING, y), f"【附魔】({len(enchantments)}种)", font=font_subtitle, fill=COLORS["pink"])
-            y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
-            for ench_key, ench_data in ench_list:
-                if isinstance(ench_data, dict):
-                    ench_cn = ench_data.get("name_cn", ench_key)
-                    draw.text((PADDING + INDENT, y), f"● {ench_cn}({ench_key})", font=font_body, fill=COLORS["gold"])
-                    y += PADDING
-                    effect = ench_data.get("effect_cn", ench_data.get("effect_en", ""))
-                    for wl in self._wrap_text(effect, font_small, content_width - INDENT_DEEP):
-                        draw.text((PADDING + INDENT_DEEP + 2 * SCALE, y), wl, font=font_small, fill=COLORS["text_dim"])
-                        y += LINE_HEIGHT_SMALL
-            if quests:
-                self._draw_divider(draw, y + SECTION_GAP, CARD_WIDTH)
-                y += SECTION_GAP * 2
-
-        if quests:
-            draw.text((PADDING, y), f"【任务】({len(quests)}个)", font=font_subtitle, fill=COLORS["green"])
-            y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
-            for qi, q in enumerate(quests, 1):
-                target = q.get("cn_target") or q.get("en_target", "")
-                reward = q.get("cn_reward") or q.get("en_reward", "")
-                if target:
-                    for wl in self._wrap_text(f"→ {target}", font_small, content_width - INDENT_DEEP):
-                        draw.text((PADDING + INDENT, y), wl, font=font_small, fill=COLORS["text_dim"])
-                        y += LINE_HEIGHT_SMALL
-                if reward:
-                    for wl in self._wrap_text(f"=> {reward}", font_small, content_width - INDENT_DEEP):
-                        draw.text((PADDING + INDENT, y), wl, font=font_small, fill=COLORS["accent"])
-                        y += LINE_HEIGHT_SMALL
-                y += SKILL_DESC_GAP
+        ops.replay(draw, body_top)
 
-        return self._save_image(img)
+        return await self._save_image(img), thumb is not None
 
     async def render_skill_card(self, skill: dict) -> bytes:
         name_cn = skill.get("name_cn", "")
@@ -770,16 +987,9 @@ class CardRenderer:
         content_width = CARD_WIDTH - PADDING * 2
 
         header_h = 70 * SCALE
-        body_h = PADDING
 
         desc_cn = skill.get("description_cn", "")
         desc_en = skill.get("description_en", "")
-        if desc_cn:
-            wrapped = self._wrap_text(desc_cn, font_body, content_width)
-            body_h += len(wrapped) * LINE_HEIGHT_BODY + SECTION_GAP
-        if desc_en:
-            wrapped = self._wrap_text(desc_en, font_small, content_width)
-            body_h += len(wrapped) * LINE_HEIGHT_SMALL + SECTION_GAP
 
         details = []
         hero_str = skill.get("heroes", "")
@@ -794,70 +1004,66 @@ class CardRenderer:
             details.append(f"标签: {skill['tags']}")
         if skill.get("hidden_tags"):
             details.append(f"隐藏标签: {skill['hidden_tags']}")
-        if details:
-            body_h += len(details) * LINE_HEIGHT_DETAIL + SECTION_GAP
 
         descriptions = skill.get("descriptions", [])
-        if descriptions and len(descriptions) > 1:
-            body_h += LINE_HEIGHT_SUBTITLE + SECTION_GAP
-            for desc in descriptions[:4]:
-                cn = desc.get("cn", "")
-                if cn:
-                    wrapped = self._wrap_text(cn, font_small, content_width - INDENT_DEEP)
-                    body_h += len(wrapped) * LINE_HEIGHT_SMALL + DESC_GAP
-
-        total_height = header_h + body_h + PADDING * 3
-        img = Image.new("RGBA", (CARD_WIDTH, total_height), COLORS["bg"])
-        draw = ImageDraw.Draw(img)
-
-        y = PADDING
-        self._draw_rounded_rect(draw, (0, 0, CARD_WIDTH, header_h + PADDING), HEADER_RADIUS, COLORS["header_bg"])
-
-        draw.text((PADDING, y + 8 * SCALE), name_cn, font=font_title, fill=COLORS["text"])
-        draw.text((PADDING, y + 40 * SCALE), name_en, font=font_subtitle, fill=COLORS["text_dim"])
-
-        self._draw_tier_badge(draw, tier_raw, tier_clean, y, CARD_WIDTH, font_tag)
 
-        y = header_h + PADDING + SECTION_GAP
+        # 布局：单次遍历计算位置并记录绘制指令（y 相对正文起点）
+        ops = _DrawOps()
+        y = 0
 
         if desc_cn:
             for wl in self._wrap_text(desc_cn, font_body, content_width):
-                draw.text((PADDING, y), wl, font=font_body, fill=COLORS["text"])
+                ops.text(PADDING, y, wl, font_body, COLORS["text"])
                 y += LINE_HEIGHT_BODY
             y += SECTION_GAP
         if desc_en:
             for wl in self._wrap_text(desc_en, font_small, content_width):
-                draw.text((PADDING, y), wl, font=font_small, fill=COLORS["text_dim"])
+                ops.text(PADDING, y, wl, font_small, COLORS["text_dim"])
                 y += LINE_HEIGHT_SMALL
             y += SECTION_GAP
 
-        self._draw_divider(draw, y, CARD_WIDTH)
+        ops.divider(y, CARD_WIDTH)
         y += SECTION_GAP
 
         if details:
-            for d in details:
-                draw.text((PADDING, y), d, font=font_small, fill=COLORS["text_dim"])
+            for line in details:
+                ops.text(PADDING, y, line, font_small, COLORS["text_dim"])
                 y += LINE_HEIGHT_DETAIL
-            self._draw_divider(draw, y, CARD_WIDTH)
+            ops.divider(y, CARD_WIDTH)
             y += SECTION_GAP
 
         if descriptions and len(descriptions) > 1:
-            draw.text((PADDING, y), "【各品质描述】", font=font_subtitle, fill=COLORS["purple"])
+            ops.text(PADDING, y, "【各品质描述】", font_subtitle, COLORS["purple"])
             y += LINE_HEIGHT_SUBTITLE + SECTION_GAP
             for desc in descriptions[:4]:
                 cn = desc.get("cn", "")
                 if cn:
                     for wl in self._wrap_text(cn, font_small, content_width - INDENT_DEEP):
-                        draw.text((PADDING + INDENT, y), wl, font=font_small, fill=COLORS["text"])
+                        ops.text(PADDING + INDENT, y, wl, font_small, COLORS["text"])
                         y += LINE_HEIGHT_SMALL
                     y += DESC_GAP
 
-        return self._save_image(img)
+        body_top = header_h + PADDING + SECTION_GAP
+        total_height = body_top + y + PADDING * 2
+        img = Image.new("RGB", (CARD_WIDTH, total_height), COLORS["bg"])
+        draw = ImageDraw.Draw(img)
+
+        y = PADDING
+        self._paste_header(img, CARD_WIDTH, header_h + PADDING)
+
+        draw.text((PADDING, y + 8 * SCALE), name_cn, font=font_title, fill=COLORS["text"])
+        draw.text((PADDING, y + 40 * SCALE), name_en, font=font_subtitle, fill=COLORS["text_dim"])
+
+        self._draw_tier_badge(draw, tier_raw, tier_clean, y, CARD_WIDTH, font_tag)
+
+        ops.replay(draw, body_top)
+
+        return await self._save_image(img, palette=True)
 
     async def render_news_card(self, title: str, date_str: str, body: str, url: str) -> bytes:
-        font_title = self._font(24 * SCALE)
+        font_title = self._font(FONT_SIZE_NEWS_TITLE)
         font_subtitle = self._font(FONT_SIZE_SUBTITLE)
-        font_body = self._font(15 * SCALE)
+        font_body = self._font(FONT_SIZE_NEWS_BODY)
         font_small = self._font(FONT_SIZE_SMALL)
         font_link = self._font(FONT_SIZE_LINK)
 
@@ -876,11 +1082,11 @@ class CardRenderer:
         footer_h = LINE_HEIGHT_LINK + PADDING
 
         total_height = header_h + body_h + footer_h + PADDING * 3
-        img = Image.new("RGBA", (news_width, total_height), COLORS["bg"])
+        img = Image.new("RGB", (news_width, total_height), COLORS["bg"])
         draw = ImageDraw.Draw(img)
 
         y = PADDING
-        self._draw_rounded_rect(draw, (0, 0, news_width, header_h + PADDING), HEADER_RADIUS, COLORS["header_bg"])
+        self._paste_header(img, news_width, header_h + PADDING)
 
         title_lines = self._wrap_text(title, font_title, content_width - 10 * SCALE)
         for tl in title_lines[:2]:
@@ -891,31 +1097,12 @@ class CardRenderer:
 
         y = header_h + PADDING + SECTION_GAP
 
-        section_color_map = {
-            "h1": COLORS["accent"],
-            "h2": COLORS["green"],
-            "h3": COLORS["orange"],
-        }
-        current_color = COLORS["text"]
-
         for line in body_lines:
             stripped = line.strip()
-            is_heading = False
-            for prefix, color in [("## ", "h2"), ("### ", "h3"), ("# ", "h1")]:
-                if stripped.startswith(prefix):
-                    heading_text = stripped[len(prefix):]
-                    draw.text((PADDING + INDENT, y), heading_text, font=font_subtitle, fill=section_color_map[color])
-                    y += LINE_HEIGHT_BODY
-                    is_heading = True
-                    break
-            if is_heading:
-                continue
-
-            if stripped.startswith("- ") or stripped.startswith("* "):
-                draw.text((PADDING + INDENT, y), stripped, font=font_body, fill=COLORS["text"])
-            elif stripped == "":
-                pass
-            else:
+            if stripped.startswith(HEADING_PREFIXES):
+                marks, _, heading_text = stripped.partition(" ")
+                draw.text((PADDING + INDENT, y), heading_text, font=font_subtitle, fill=HEADING_COLORS[len(marks)])
+            elif stripped:
                 draw.text((PADDING + INDENT, y), stripped, font=font_body, fill=COLORS["text"])
             y += LINE_HEIGHT_BODY
 
@@ -928,12 +1115,12 @@ class CardRenderer:
             draw.text((PADDING, y), ul, font=font_link, fill=COLORS["accent"])
             y += LINE_HEIGHT_LINK
 
-        return self._save_image(img)
+        return await self._save_image(img, palette=True)
 
     async def render_patch_cards(self, title: str, date_str: str, version: str, sections: list[tuple[str, str]], url: str) -> list[bytes]:
-        font_title = self._font(24 * SCALE)
+        font_title = self._font(FONT_SIZE_NEWS_TITLE)
         font_subtitle = self._font(FONT_SIZE_SUBTITLE)
-        font_body = self._font(15 * SCALE)
+        font_body = self._font(FONT_SIZE_NEWS_BODY)
         font_small = self._font(FONT_SIZE_SMALL)
         font_link = self._font(FONT_SIZE_LINK)
 
@@ -954,7 +1141,7 @@ class CardRenderer:
                 if not stripped:
                     sec_lines.append("")
                     continue
-                if stripped.startswith("### ") or stripped.startswith("## ") or stripped.startswith("# "):
+                if stripped.startswith(HEADING_PREFIXES):
                     sec_lines.append(stripped)
                     continue
 
@@ -995,10 +1182,10 @@ class CardRenderer:
             footer_h = max(2, len(footer_lines[:2])) * LINE_HEIGHT_LINK + PADDING
             total_height = header_h + body_h + footer_h + PADDING * 3
 
-            img = Image.new("RGBA", (card_width, total_height), COLORS["bg"])
+            img = Image.new("RGB", (card_width, total_height), COLORS["bg"])
             draw = ImageDraw.Draw(img)
 
-            self._draw_rounded_rect(draw, (0, 0, card_width, header_h + PADDING), HEADER_RADIUS, COLORS["header_bg"])
+            self._paste_header(img, card_width, header_h + PADDING)
 
             y = PADDING
             head_title = title
@@ -1020,12 +1207,9 @@ class CardRenderer:
                 indent_level = min(max(0, indent_spaces // 2), 6)
                 text_x = PADDING + INDENT + indent_level * (INDENT // 2)
                 display_text = raw_line.lstrip(" ")
-                if stripped.startswith("### "):
-                    draw.text((PADDING + INDENT, y), stripped[4:], font=font_subtitle, fill=COLORS["orange"])
-                elif stripped.startswith("## "):
-                    draw.text((PADDING + INDENT, y), stripped[3:], font=font_subtitle, fill=COLORS["green"])
-                elif stripped.startswith("# "):
-                    draw.text((PADDING + INDENT, y), stripped[2:], font=font_subtitle, fill=COLORS["accent"])
+                if stripped.startswith(HEADING_PREFIXES):
+                    marks, _, heading_text = stripped.partition(" ")
+                    draw.text((PADDING + INDENT, y), heading_text, font=font_subtitle, fill=HEADING_COLORS[len(marks)])
                 else:
                     self._draw_markdown_emphasis_line(
                         draw,
@@ -1045,12 +1229,12 @@ class CardRenderer:
                 draw.text((PADDING, y), ul, font=font_link, fill=COLORS["accent"])
                 y += LINE_HEIGHT_LINK
 
-            images.append(self._save_image(img))
+            images.append(await self._save_image(img, palette=True))
 
         return images
 
     def describe_patch_pages(self, sections: list[tuple[str, str]]) -> list[str]:
-        font_body = self._font(15 * SCALE)
+        font_body = self._font(FONT_SIZE_NEWS_BODY)
         card_width = BUILD_CARD_WIDTH
         content_width = card_width - PADDING * 2
         normalized_sections = sections or [("补丁更新", "")]
@@ -1074,27 +1258,12 @@ class CardRenderer:
     async def render_tierlist_card(self, hero_en: str, hero_cn: str, tier_items: dict) -> bytes:
         import asyncio
 
-        font_title = self._font(24 * SCALE)
+        font_title = self._font(FONT_SIZE_NEWS_TITLE)
         font_grade = self._font(32 * SCALE)
         font_small = self._font(FONT_SIZE_TAG)
         font_link = self._font(FONT_SIZE_LINK)
         font_pct = self._font(10 * SCALE)
 
-        grade_colors = {
-            "S": (255, 69, 58),
-            "A": (255, 159, 10),
-            "B": (50, 215, 75),
-            "C": (100, 210, 255),
-        }
-
-        tier_border_colors = {
-            "Bronze": (205, 127, 50),
-            "Silver": (192, 192, 192),
-            "Gold": (255, 215, 0),
-            "Diamond": (185, 242, 255),
-            "Legendary": (255, 121, 198),
-        }
-
         thumb_h = 80 * SCALE
         size_widths = {
             "Small": int(thumb_h * 0.55),
@@ -1112,11 +1281,15 @@ class CardRenderer:
                 all_items.append(it)
 
         image_tasks = {}
-        for idx, it in enumerate(all_items):
+        for it in all_items:
             url = it.get("image_url", "")
             if url:
-                key = f"{idx}:{it['name']}"
-                image_tasks[key] = self._fetch_image(url)
+                # 取图后立即在工作线程中缩放到格子尺寸，各物品的下载与缩放并行进行；
+                # 同图同尺寸的物品共用一个任务，并发时不会重复缩放
+                tw = size_widths.get(it.get("size", "Medium"), thumb_h)
+                key = (url, tw, thumb_h)
+                if key not in image_tasks:
+                    image_tasks[key] = self._fetch_thumbnail(url, (tw, thumb_h))
                 it["_img_key"] = key
         fetched = {}
         if image_tasks:
@@ -1162,39 +1335,54 @@ class CardRenderer:
         footer_h = LINE_HEIGHT_LINK * 2 + PADDING
         total_height = header_h + body_h + footer_h + PADDING * 3
 
-        img = Image.new("RGBA", (card_width, total_height), COLORS["bg"])
+        # 画布用 RGB：RGBA 画布上的 Draw 不做 alpha 混合，半透明角标需在 RGB 画布上以 RGBA 模式绘制
+        img = Image.new("RGB", (card_width, total_height), COLORS["bg"])
         draw = ImageDraw.Draw(img)
+        overlay = ImageDraw.Draw(img, "RGBA")
 
         y = PADDING
-        self._draw_rounded_rect(draw, (0, 0, card_width, header_h + PADDING), HEADER_RADIUS, COLORS["header_bg"])
+        self._paste_header(img, card_width, header_h + PADDING)
         total_items = sum(len(v) for v in tier_items.values())
         draw.text((PADDING, y + 6 * SCALE), f"{hero_cn}({hero_en}) 物品评级", font=font_title, fill=COLORS["text"])
         draw.text((PADDING, y + 38 * SCALE), f"共{total_items}个物品 | 数据来源: BazaarForge.gg", font=font_small, fill=COLORS["text_dim"])
 
         y = header_h + PADDING + SECTION_GAP
 
+        # 物品格子循环内的颜色、测量与绘制方法绑定为局部变量，省去每次的属性查找
+        text_col = COLORS["text"]
+        text_dim = COLORS["text_dim"]
+        text_bbox = self._text_bbox
+        draw_text = draw.text
+        draw_rect = draw.rectangle
+        draw_rrect = draw.rounded_rectangle
+        overlay_rrect = overlay.rounded_rectangle
+        paste = img.paste
+        size_width = size_widths.get
+        border_color_of = TIER_BORDER_COLORS.get
+        fetched_thumb = fetched.get
+
         for grade in ["S", "A", "B", "C"]:
             if grade not in grade_rows:
                 continue
             rows = grade_rows[grade]
             items = tier_items[grade]
 
-            color = grade_colors.get(grade, COLORS["text"])
+            color = GRADE_COLORS.get(grade, text_col)
             row_h = len(rows) * (thumb_h + thumb_gap) + row_pad * 2
 
-            draw.rounded_rectangle(
+            draw_rrect(
                 (0, y, label_w, y + row_h),
                 radius=0, fill=color
             )
-            grade_bbox = font_grade.getbbox(grade)
+            grade_bbox = text_bbox(font_grade, grade)
             gw = grade_bbox[2] - grade_bbox[0]
             gh = grade_bbox[3] - grade_bbox[1]
-            draw.text(
+            draw_text(
                 ((label_w - gw) // 2, y + (row_h - gh) // 2),
                 grade, font=font_grade, fill=(30, 30, 40)
             )
 
-            draw.rectangle(
+            draw_rect(
                 (label_w, y, card_width, y + row_h),
                 fill=(50, 52, 65)
             )
@@ -1203,34 +1391,33 @@ class CardRenderer:
             for row in rows:
                 ix = content_x
                 for it in row:
-                    tw = size_widths.get(it.get("size", "Medium"), thumb_h)
+                    tw = size_width(it.get("size", "Medium"), thumb_h)
 
-                    border_color = tier_border_colors.get(it.get("tier", ""), COLORS["text_dim"])
-                    draw.rounded_rectangle(
+                    border_color = border_color_of(it.get("tier", ""), text_dim)
+                    draw_rrect(
                         (ix - border_w, iy - border_w, ix + tw + border_w, iy + thumb_h + border_w),
                         radius=4 * SCALE, fill=border_color
                     )
 
-                    item_img = fetched.get(it.get("_img_key", ""))
-                    if item_img:
-                        resized = item_img.resize((tw, thumb_h), Image.LANCZOS)
-                        img.paste(resized, (ix, iy), resized if resized.mode == "RGBA" else None)
+                    thumb = fetched_thumb(it.get("_img_key"))
+                    if thumb:
+                        paste(thumb, (ix, iy), thumb if thumb.mode == "RGBA" else None)
                     else:
-                        draw.rectangle((ix, iy, ix + tw, iy + thumb_h), fill=(60, 63, 80))
+                        draw_rect((ix, iy, ix + tw, iy + thumb_h), fill=(60, 63, 80))
                         name_short = (it.get("name_cn") or it["name"])[:3]
-                        draw.text((ix + 2 * SCALE, iy + thumb_h // 2 - 8 * SCALE), name_short, font=font_small, fill=COLORS["text"])
+                        draw_text((ix + 2 * SCALE, iy + thumb_h // 2 - 8 * SCALE), name_short, font=font_small, fill=text_col)
 
                     pct_text = f"{it['pct']:.0f}%"
-                    pct_bbox = font_pct.getbbox(pct_text)
+                    pct_bbox = text_bbox(font_pct, pct_text)
                     pw = pct_bbox[2] - pct_bbox[0]
                     ph = pct_bbox[3] - pct_bbox[1]
                     pct_bg_x = ix + tw - pw - 4 * SCALE
                     pct_bg_y = iy + thumb_h - ph - 4 * SCALE
-                    draw.rounded_rectangle(
+                    overlay_rrect(
                         (pct_bg_x - 2 * SCALE, pct_bg_y - 2 * SCALE, pct_bg_x + pw + 4 * SCALE, pct_bg_y + ph + 4 * SCALE),
                         radius=2 * SCALE, fill=(0, 0, 0, 180)
                     )
-                    draw.text((pct_bg_x, pct_bg_y), pct_text, font=font_pct, fill=(255, 255, 255))
+                    draw_text((pct_bg_x, pct_bg_y), pct_text, font=font_pct, fill=(255, 255, 255))
 
                     ix += tw + thumb_gap
 
@@ -1249,7 +1436,7 @@ class CardRenderer:
             font=font_link, fill=COLORS["accent"]
         )
 
-        return self._save_image(img)
+        return await self._save_image(img)
 
     async def render_merchant_card(self, merchant: dict) -> bytes:
         font_title = self._font(FONT_SIZE_TITLE)
@@ -1266,8 +1453,7 @@ class CardRenderer:
         slug = merchant.get("name_slug", "")
 
         category_cn = "商人" if category == "Merchant" else "训练师" if category == "Trainer" else category
-        tier_cn = {"Bronze": "青铜", "Silver": "白银", "Gold": "黄金", "Diamond": "钻石", "Legendary": "传说"}.get(tier, tier)
-        hero_cn_map = {"Common": "通用", "Dooley": "杜利", "Jules": "朱尔斯", "Mak": "马克", "Pygmalien": "皮格马利翁", "Stelle": "斯黛拉", "Vanessa": "瓦妮莎"}
+        tier_cn = TIER_CN_MAP.get(tier, tier)
 
         content_width = CARD_WIDTH - PADDING * 2
         header_h = THUMB_SIZE + PADDING * 2
@@ -1276,28 +1462,34 @@ class CardRenderer:
         body_lines.append(("📋 类型", category_cn))
         body_lines.append(("💎 品质", f"{tier_cn}({tier})"))
         body_lines.append(("📝 描述", desc))
-        heroes_str = " | ".join(hero_cn_map.get(h, h) for h in heroes)
+        heroes_str = " | ".join(HERO_CN_MAP.get(h, h) for h in heroes)
         body_lines.append(("👥 可用英雄", heroes_str))
 
-        body_h = 0
+        # 布局：单次遍历计算位置并记录绘制指令（y 相对正文起点）
+        ops = _DrawOps()
+        y = 0
         for label, value in body_lines:
-            wrapped = self._wrap_text(f"{label}: {value}", font_body, content_width)
-            body_h += len(wrapped) * LINE_HEIGHT_BODY + SECTION_GAP
+            for line in self._wrap_text(f"{label}: {value}", font_body, content_width):
+                ops.text(PADDING, y, line, font_body, COLORS["text"])
+                y += LINE_HEIGHT_BODY
+            y += SECTION_GAP
+        if slug:
+            ops.text(PADDING, y, f"https://bazaarforge.gg/merchants/{slug}", font_link, COLORS["accent"])
 
         link_h = LINE_HEIGHT_LINK + PADDING if slug else PADDING
-        total_height = header_h + body_h + link_h + PADDING * 2
+        total_height = header_h + y + link_h + PADDING * 2
 
-        img_card = Image.new("RGBA", (CARD_WIDTH, total_height), COLORS["bg"])
+        img_card = Image.new("RGB", (CARD_WIDTH, total_height), COLORS["bg"])
         draw = ImageDraw.Draw(img_card)
 
-        self._draw_rounded_rect(draw, (0, 0, CARD_WIDTH, header_h), HEADER_RADIUS, COLORS["header_bg"])
+        self._paste_header(img_card, CARD_WIDTH, header_h)
 
         thumb_img = None
         img_url = merchant.get("image_url_fg") or merchant.get("image_url", "")
         if img_url:
             thumb_img = await self._fetch_image(img_url)
         if thumb_img:
-            thumb_img = thumb_img.resize((THUMB_SIZE, THUMB_SIZE), Image.LANCZOS)
+            thumb_img = self._resize_thumbnail(thumb_img, (THUMB_SIZE, THUMB_SIZE))
             img_card.paste(thumb_img, (PADDING, PADDING), thumb_img if thumb_img.mode == "RGBA" else None)
 
         text_x = THUMB_MARGIN + PADDING
@@ -1306,8 +1498,8 @@ class CardRenderer:
         draw.text((text_x, PADDING + 8 * SCALE + LINE_HEIGHT_TITLE), category_cn, font=font_subtitle, fill=COLORS["text_dim"])
 
         badge_text = f" {tier_cn} "
-        bbox = font_small.getbbox(badge_text)
-        bw = bbox[2] - bbox[0] + 8 * SCALE
+        badge_bbox = self._text_bbox(font_small, badge_text)
+        bw = badge_bbox[2] - badge_bbox[0] + 8 * SCALE
         badge_y = PADDING + 8 * SCALE + LINE_HEIGHT_TITLE + LINE_HEIGHT_SUBTITLE + 4 * SCALE
         draw.rounded_rectangle(
             (text_x, badge_y, text_x + bw, badge_y + LINE_HEIGHT_SMALL),
@@ -1315,105 +1507,85 @@ class CardRenderer:
         )
         draw.text((text_x + 4 * SCALE, badge_y + 2 * SCALE), badge_text.strip(), font=font_small, fill=COLORS["bg"])
 
-        y = header_h + PADDING
-        for label, value in body_lines:
-            full_text = f"{label}: {value}"
-            wrapped = self._wrap_text(full_text, font_body, content_width)
-            for line in wrapped:
-                draw.text((PADDING, y), line, font=font_body, fill=COLORS["text"])
-                y += LINE_HEIGHT_BODY
-            y += SECTION_GAP
-
-        if slug:
-            link_url = f"https://bazaarforge.gg/merchants/{slug}"
-            draw.text((PADDING, y), link_url, font=font_link, fill=COLORS["accent"])
+        ops.replay(draw, header_h + PADDING)
 
-        return self._save_image(img_card)
+        return await self._save_image(img_card)
 
     async def render_build_card(self, query: str, search_term: str, builds: list) -> bytes:
-        font_title = self._font(24 * SCALE)
+        font_title = self._font(FONT_SIZE_NEWS_TITLE)
         font_subtitle = self._font(FONT_SIZE_SUBTITLE)
-        font_body = self._font(15 * SCALE)
+        font_body = self._font(FONT_SIZE_NEWS_BODY)
         font_small = self._font(FONT_SIZE_TAG)
         font_link = self._font(FONT_SIZE_LINK)
 
         content_width = BUILD_CARD_WIDTH - PADDING * 2
 
         header_h = 60 * SCALE
-        body_h = 0
-
-        for build in builds:
-            bh = 0
-            title_lines = self._wrap_text(build["title"], font_subtitle, content_width - INDENT)
-            bh += len(title_lines) * LINE_HEIGHT_SUBTITLE
-            bh += PADDING
-            if build.get("excerpt"):
-                excerpt_lines = self._wrap_text(build["excerpt"], font_small, content_width - INDENT)
-                bh += len(excerpt_lines) * LINE_HEIGHT_EXCERPT
-                bh += SKILL_DESC_GAP
-            bh += LINE_HEIGHT_SMALL
-            bh += LINE_HEIGHT_LINK
-            body_h += bh
-
-        body_h += (len(builds) - 1) * SECTION_GAP
-        footer_h = 30 * SCALE
-
-        total_height = header_h + body_h + footer_h + PADDING * 3
-        img = Image.new("RGBA", (BUILD_CARD_WIDTH, total_height), COLORS["bg"])
-        draw = ImageDraw.Draw(img)
-
-        y = PADDING
-        self._draw_rounded_rect(draw, (0, 0, BUILD_CARD_WIDTH, header_h + PADDING), HEADER_RADIUS, COLORS["header_bg"])
-
-        title_text = f"「{query}」推荐阵容"
-        draw.text((PADDING, y + 6 * SCALE), title_text, font=font_title, fill=COLORS["text"])
-        sub = f"来源: bazaar-builds.net | 共{len(builds)}条结果"
-        if search_term != query:
-            sub = f"搜索: {search_term} | " + sub
-        draw.text((PADDING, y + 34 * SCALE), sub, font=font_small, fill=COLORS["text_dim"])
-
-        y = header_h + PADDING + SECTION_GAP
 
+        # 布局：单次遍历计算位置并记录绘制指令（y 相对正文起点），画布高度与实际内容一致
+        ops = _DrawOps()
+        badges = []
+        y = 0
         for i, build in enumerate(builds):
             num_badge = f" {i + 1} "
-            bbox = font_body.getbbox(num_badge)
-            bw = bbox[2] - bbox[0] + INDENT
-            draw.rounded_rectangle(
-                (PADDING, y, PADDING + bw, y + LINE_HEIGHT_SUBTITLE), radius=BADGE_RADIUS, fill=COLORS["accent"]
-            )
-            draw.text((PADDING + 5 * SCALE, y + 2 * SCALE), num_badge.strip(), font=font_body, fill=COLORS["bg"])
+            badge_bbox = self._text_bbox(font_body, num_badge)
+            bw = badge_bbox[2] - badge_bbox[0] + INDENT
+            badges.append((y, bw, num_badge.strip()))
 
             title_x = PADDING + bw + 8 * SCALE
             title_lines = self._wrap_text(build["title"], font_subtitle, content_width - bw - INDENT)
             for j, tl in enumerate(title_lines):
-                draw.text((title_x if j == 0 else PADDING + INDENT, y), tl, font=font_subtitle, fill=COLORS["text"])
+                ops.text(title_x if j == 0 else PADDING + INDENT, y, tl, font_subtitle, COLORS["text"])
                 y += LINE_HEIGHT_SUBTITLE
 
             y += DESC_GAP
-            draw.text((PADDING + INDENT, y), f"{build['date']}", font=font_small, fill=COLORS["text_dim"])
+            ops.text(PADDING + INDENT, y, f"{build['date']}", font_small, COLORS["text_dim"])
             y += LINE_HEIGHT_LINK
 
             if build.get("excerpt"):
                 excerpt_lines = self._wrap_text(build["excerpt"], font_small, content_width - INDENT)
-                for el in excerpt_lines:
-                    draw.text((PADDING + INDENT, y), el, font=font_small, fill=COLORS["text_dim"])
+                for line in excerpt_lines:
+                    ops.text(PADDING + INDENT, y, line, font_small, COLORS["text_dim"])
                     y += LINE_HEIGHT_EXCERPT
                 y += SKILL_DESC_GAP
 
-            draw.text((PADDING + INDENT, y), f"{build['link']}", font=font_link, fill=COLORS["accent"])
+            ops.text(PADDING + INDENT, y, f"{build['link']}", font_link, COLORS["accent"])
             y += LINE_HEIGHT_SMALL
 
             if i < len(builds) - 1:
                 y += DESC_GAP
-                self._draw_divider(draw, y, BUILD_CARD_WIDTH)
+                ops.divider(y, BUILD_CARD_WIDTH)
                 y += SKILL_DESC_GAP
 
         y += SECTION_GAP
         more_url = f"https://bazaar-builds.net/?s={search_term.replace(' ', '+')}"
         more_text = f"更多阵容: {more_url}"
-        more_lines = self._wrap_text(more_text, font_link, content_width)
-        for ml in more_lines:
-            draw.text((PADDING, y), ml, font=font_link, fill=COLORS["green"])
+        for ml in self._wrap_text(more_text, font_link, content_width):
+            ops.text(PADDING, y, ml, font_link, COLORS["green"])
             y += LINE_HEIGHT_LINK
 
-        return self._save_image(img)
+        body_top = header_h + PADDING + SECTION_GAP
+        total_height = body_top + y + PADDING * 2
+        img = Image.new("RGB", (BUILD_CARD_WIDTH, total_height), COLORS["bg"])
+        draw = ImageDraw.Draw(img)
+
+        y = PADDING
+        self._paste_header(img, BUILD_CARD_WIDTH, header_h + PADDING)
+
+        title_text = f"「{query}」推荐阵容"
+        draw.text((PADDING, y + 6 * SCALE), title_text, font=font_title, fill=COLORS["text"])
+        sub = f"来源: bazaar-builds.net | 共{len(builds)}条结果"
+        if search_term != query:
+            sub = f"搜索: {search_term} | " + sub
+        draw.text((PADDING, y + 34 * SCALE), sub, font=font_small, fill=COLORS["text_dim"])
+
+        # 序号徽章是圆角矩形，不经过 _DrawOps，按记录的位置直接绘制
+        for badge_y, bw, num_badge in badges:
+            badge_y += body_top
+            draw.rounded_rectangle(
+                (PADDING, badge_y, PADDING + bw, badge_y + LINE_HEIGHT_SUBTITLE), radius=BADGE_RADIUS, fill=COLORS["accent"]
+            )
+            draw.text((PADDING + 5 * SCALE, badge_y + 2 * SCALE), num_badge, font=font_body, fill=COLORS["bg"])
+        ops.replay(draw, body_top)
+
+        return await self._save_image(img, palette=True)
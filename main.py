@@ -4,6 +4,7 @@ import hashlib
 import json
 import os
 import re
+import sys
 import time
 import html as html_module
 from collections import OrderedDict
@@ -14,6 +15,11 @@ from functools import lru_cache
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from astrbot.api.event import filter, AstrMessageEvent
 from astrbot.api.star import Context, Star, register
 from astrbot.api import logger, AstrBotConfig
@@ -148,6 +154,7 @@ CACHE_TTL_NEWS = 1800         # 新闻缓存 30 分钟
 CACHE_TTL_ITEM_UUID = 3600    # 物品 UUID 缓存 1 小时
 CACHE_TTL_IMAGE = 86400       # 图片缓存 24 小时
 CACHE_TTL_RENDER = 7200       # 渲染结果缓存 2 小时
+CACHE_TTL_RENDER_NO_THUMB = 60  # 缩略图未取到的渲染结果只缓存 1 分钟
 
 # 缓存大小限制
 CACHE_MAX_SIZE = 1000         # 最大缓存条目数
@@ -181,14 +188,116 @@ BUILD_POSITIVE_PATTERN = re.compile(
 )
 
 TIER_EMOJI = {"Bronze": "🥉", "Silver": "🥈", "Gold": "🥇", "Diamond": "💎"}
+TIER_CN_MAP = {"Bronze": "青铜", "Silver": "白银", "Gold": "黄金", "Diamond": "钻石", "Legendary": "传说"}
+TIER_CN_TO_EN = {"青铜": "Bronze", "白银": "Silver", "黄金": "Gold", "钻石": "Diamond", "传奇": "Legendary"}
+GRADE_EMOJI = {"S": "🏆", "A": "🥇", "B": "🥈", "C": "🥉"}
+
+# 物品数值字段：(数值键, 各品质数值键, 显示名)，按展示顺序排列
+ITEM_STAT_FIELDS = (
+    ("damage", "damage_tiers", "伤害"),
+    ("heal", "heal_tiers", "治疗"),
+    ("shield", "shield_tiers", "护盾"),
+    ("burn", "burn_tiers", "灼烧"),
+    ("poison", "poison_tiers", "中毒"),
+    ("regen", "regen_tiers", "再生"),
+    ("lifesteal", "lifesteal_tiers", "吸血"),
+    ("ammo", "ammo_tiers", "弹药"),
+    ("crit", "crit_tiers", "暴击"),
+    ("multicast", "multicast_tiers", "多重触发"),
+)
 
 
+@lru_cache(maxsize=256)
 def _clean_tier(raw: str) -> str:
     if not raw:
         return ""
     return raw.split("/")[0].strip().split(" ")[0].strip()
 
 
+# 取值种类很少、在数据中大量重复的字段，加载时驻留（sys.intern）以共享同一字符串对象
+ITEM_INTERN_FIELDS = ("type", "size", "starting_tier", "available_tiers", "heroes", "tags")
+MONSTER_ENTRY_INTERN_FIELDS = ("tier", "current_tier")
+
+# 预先转小写的搜索字段，加载数据时写入 "_lc_<字段>"，查询时不再逐条 lower()
+ITEM_SEARCH_FIELDS = ("name_cn", "name_en", "tags", "hidden_tags", "heroes", "size")
+SKILL_SEARCH_FIELDS = ("name_cn", "name_en", "description_cn", "description_en", "heroes")
+MONSTER_SEARCH_FIELDS = ("name", "name_zh")
+MONSTER_ENTRY_SEARCH_FIELDS = ("name", "name_en")
+EVENT_SEARCH_FIELDS = ("name", "name_en")
+EVENT_CHOICE_SEARCH_FIELDS = ("name", "name_zh", "description_zh", "description")
+# 关键词搜索命中的物品字段（不含尺寸）
+ITEM_KEYWORD_FIELDS = ("name_cn", "name_en", "tags", "hidden_tags", "heroes")
+# 拼接搜索文本的分隔符，不会出现在关键词中，因此不会产生跨字段的误匹配
+SEARCH_BLOB_SEP = "\x01"
+# 关键词搜索结果缓存条数（按类型+关键词），群聊里重复查询同一关键词很常见
+SEARCH_RESULT_CACHE_SIZE = 128
+# 物品标签文本中分隔标签的字符；不含这些字符的标签条件只可能落在单个标签内，可直接查标签索引
+TAG_SEPARATOR_CHARS = " /|"
+
+
+def _read_json(path: Path) -> Any:
+    """读取 JSON 文件；安装了 orjson 时用它解析（直接解析字节，速度快数倍）"""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_compact_json(path: Path, data: Any):
+    """以紧凑格式（无缩进和多余空白）写入 JSON，文件更小，启动时解析也更快"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def _unique_monster_items(items: list) -> list:
+    """同一物品可能在多个品质下重复出现，按 id（缺省时按名称）保留首次出现的条目"""
+    seen = set()
+    unique = []
+    for item in items:
+        item_id = item.get("id", item.get("name", ""))
+        if item_id not in seen:
+            seen.add(item_id)
+            unique.append(item)
+    return unique
+
+
+def _attach_lowercase(entry: dict, fields: tuple):
+    for field in fields:
+        entry["_lc_" + field] = (entry.get(field) or "").lower()
+
+
+def _intern_fields(entry: dict, fields: tuple):
+    for field in fields:
+        value = entry.get(field)
+        if type(value) is str:
+            entry[field] = sys.intern(value)
+
+
+def _add_trigrams(index: dict[str, set[int]], entry_index: int, texts):
+    for text in texts:
+        for i in range(len(text) - 2):
+            gram = text[i:i + 3]
+            postings = index.get(gram)
+            if postings is None:
+                index[gram] = {entry_index}
+            else:
+                postings.add(entry_index)
+
+
+def _trigram_candidates(index: dict[str, set[int]], kw: str) -> list[int] | None:
+    """返回可能包含 kw 的条目下标（升序）；kw 不足 3 个字符时返回 None 表示需全量扫描"""
+    if len(kw) < 3:
+        return None
+    postings = []
+    for i in range(len(kw) - 2):
+        p = index.get(kw[i:i + 3])
+        if not p:
+            return []
+        postings.append(p)
+    postings.sort(key=len)
+    return sorted(postings[0].intersection(*postings[1:]))
+
+
 def _clean_bilingual(raw: str) -> tuple:
     if not raw:
         return ("", "")
@@ -482,6 +591,78 @@ CONFIG_KEY_MAP = {
 }
 
 
+# 帮助文本中与数据无关的固定部分
+HELP_COMMANDS_TEXT = (
+    "📋 可用指令:\n\n"
+    "/tbzmonster <名称> - 查询怪物详情(图片卡片)\n"
+    "  示例: /tbzmonster 火灵\n\n"
+    "/tbzitem <名称> - 查询物品详情(图片卡片)\n"
+    "  示例: /tbzitem 地下商街\n\n"
+    "/tbzskill <名称> - 查询技能详情(图片卡片)\n"
+    "  示例: /tbzskill 热情如火\n\n"
+    "/tbzevent <名称> - 查询事件选项\n"
+    "  示例: /tbzevent 奇异蘑菇\n\n"
+    "/tbzsearch <条件> - 智能多条件搜索\n"
+    "  直接连写: /tbzsearch 杜利中型灼烧\n"
+    "  空格分隔: /tbzsearch 马克 黄金 武器\n"
+    "  前缀语法: /tbzsearch tag:Weapon hero:Mak\n"
+    "  英雄事件: /tbzsearch hero:Jules (含该英雄事件)\n"
+    "  无参数: /tbzsearch (显示搜索帮助)\n\n"
+    "/tbznews [数量] - 查询游戏官方更新公告(图片)\n"
+    "  示例: /tbznews 或 /tbznews 3\n\n"
+    "/tbzpatch [版本号] - 查询中文补丁说明\n"
+    "  示例: /tbzpatch 或 /tbzpatch 11.0\n\n"
+    "/tbzbuild <物品名> [数量] - 查询推荐阵容\n"
+    "  示例: /tbzbuild 符文匕首\n\n"
+    "/tbztier <英雄名> - 查询英雄物品评级(Tier List)\n"
+    "  示例: /tbztier 海盗 或 /tbztier Vanessa\n\n"
+    "/tbzguide <英雄名> - 查询英雄一图流攻略\n"
+    "  示例: /tbzguide 海盗 或 /tbzguide Vanessa\n\n"
+    "/tbzmerchant <名称> - 查询商人/训练师信息\n"
+    "  示例: /tbzmerchant Aila 或 /tbzmerchant Weapon\n\n"
+    "/tbzalias - 别名管理(查看/添加/删除)\n"
+    "  查看: /tbzalias list [分类]\n"
+    "  添加: /tbzalias add hero 猪猪 Pygmalien\n"
+    "  删除: /tbzalias del hero 猪猪\n\n"
+    "/tbzupdate - 从远端更新游戏数据\n\n"
+    "/tbzcache - 查看/清理缓存\n"
+    "  /tbzcache stats - 查看缓存统计\n"
+    "  /tbzcache clear - 清理内存缓存\n\n"
+    "/tbzhelp - 显示此帮助信息\n"
+    "━━━━━━━━━━━━━━━━━━\n"
+    "数据来源: BazaarHelper | BazaarForge | bazaar-builds.net | Steam\n\n"
+    "💡 AI 工具: 本插件支持 AI 自动调用，需要 AstrBot 配置支持函数调用的 LLM 模型"
+)
+
+SEARCH_HELP_USAGE_TEXT = (
+    "🔍 多条件搜索帮助\n"
+    "━━━━━━━━━━━━━━━━━━\n"
+    "用法: /tbzsearch [条件...]\n\n"
+    "支持智能识别，可直接连写条件，无需前缀:\n"
+    "  /tbzsearch 杜利中型灼烧\n"
+    "  /tbzsearch 马克黄金武器\n"
+    "  /tbzsearch 青铜食物\n\n"
+    "也支持前缀语法:\n"
+    "  tag:标签名 / 标签:标签名\n"
+    "  tier:品质 / 品质:品质名\n"
+    "  hero:英雄 / 英雄:英雄名\n"
+    "  size:尺寸 / 尺寸:尺寸名\n\n"
+    "示例:\n"
+    "  /tbzsearch 灼烧\n"
+    "  /tbzsearch tag:Weapon hero:Mak\n"
+    "  /tbzsearch tier:Gold tag:Weapon\n\n"
+)
+
+SEARCH_HELP_TIERS_TEXT = "📊 品质: Bronze(青铜), Silver(白银), Gold(黄金), Diamond(钻石)"
+
+TIER_USAGE_TEXT = (
+    "请输入英雄名称查询物品评级，例如:\n"
+    "  /tbztier 海盗\n"
+    "  /tbztier Vanessa\n"
+    "  /tbztier 杜利\n\n"
+)
+
+
 @register("astrbot_plugin_bazaar", "大巴扎小助手", "The Bazaar 游戏数据查询，支持怪物、物品、技能、事件、阵容、更新公告、物品评级查询，图片卡片展示，AI 人格预设与工具自动调用", "v1.1.7")
 class BazaarPlugin(Star):
     def __init__(self, context: Context, config: AstrBotConfig = None):
@@ -492,6 +673,28 @@ class BazaarPlugin(Star):
         self.skills = []
         self.events = []
         self.merchants = []
+        self._item_trigrams: dict[str, set[int]] = {}
+        self._monster_trigrams: dict[str, set[int]] = {}
+        self._skill_trigrams: dict[str, set[int]] = {}
+        self._monster_entries: list[tuple[str, dict]] = []
+        # 关键词搜索用的小写拼接文本，与 items/skills/_monster_entries/events 按下标一一对应
+        self._item_blobs: list[str] = []
+        self._skill_blobs: list[str] = []
+        self._monster_blobs: list[str] = []
+        self._event_blobs: list[str] = []
+        self._search_results: OrderedDict[tuple[str, str], tuple] = OrderedDict()
+        # 精确名称（小写）-> 条目，同名时保留数据中靠前的一条
+        self._monster_by_name: dict[str, tuple[str, dict]] = {}
+        self._item_by_name: dict[str, dict] = {}
+        self._monster_item_by_name: dict[str, tuple[str, dict, dict]] = {}
+        # 数据版本号，每次加载数据后递增；渲染缓存键带上版本，更新数据后旧卡片自动失效
+        self._data_version = 0
+        # 物品品质分桶（按清洗后的起始品质）与搜索帮助用的标签/英雄列表
+        self._items_by_tier: dict[str, list[dict]] = {}
+        # 标签索引：小写标签（含隐藏标签）-> 物品下标（升序）
+        self._item_tag_index: dict[str, list[int]] = {}
+        self._tags_sorted: list[str] = []
+        self._item_heroes_sorted: list[str] = []
         self.aliases: dict[str, dict[str, str]] = {}
         self._hero_alias_map: dict[str, str] = {}
         self._hero_cn_map: dict[str, str] = dict(HERO_CN_MAP)
@@ -556,6 +759,20 @@ class BazaarPlugin(Star):
         """设置图片/渲染缓存"""
         self._cache.set(key, data, ttl)
 
+    async def _render_card_cached(self, cache_key: str, render: Callable) -> bytes:
+        """渲染卡片并缓存 PNG 结果，同一条目重复查询时直接返回
+
+        render 返回 PNG，或 (PNG, 是否画上了头部图片)；图片没取到（如网络错误）时结果只短暂缓存，稍后重新渲染。
+        """
+        key = f"img:{cache_key}:v{self._data_version}"
+        cached = self._get_img_cache(key, CACHE_TTL_RENDER)
+        if cached:
+            return cached
+        result = await render()
+        img_bytes, has_image = result if isinstance(result, tuple) else (result, True)
+        self._set_img_cache(key, img_bytes, CACHE_TTL_RENDER if has_image else CACHE_TTL_RENDER_NO_THUMB)
+        return img_bytes
+
     def _get_patch_card_cache_dir(self) -> Path:
         cache_dir = self.plugin_dir / "data" / "cache" / PATCH_CARD_DISK_DIR
         cache_dir.mkdir(parents=True, exist_ok=True)
@@ -1107,7 +1324,7 @@ class BazaarPlugin(Star):
         return q
 
     async def initialize(self):
-        self._load_data()
+        await self._load_data()
         self._load_aliases()
         if not self.config:
             path = self.plugin_dir / "data" / "aliases.json"
@@ -1245,8 +1462,7 @@ class BazaarPlugin(Star):
         for alias, target in self._hero_alias_map.items():
             if len(alias) >= 2:
                 vocab[alias] = ("hero", target)
-        tier_cn_to_en = {"青铜": "Bronze", "白银": "Silver", "黄金": "Gold", "钻石": "Diamond", "传奇": "Legendary"}
-        for cn, en in tier_cn_to_en.items():
+        for cn, en in TIER_CN_TO_EN.items():
             vocab[cn] = ("tier", en)
             vocab[en.lower()] = ("tier", en)
         self._vocab = vocab
@@ -1414,41 +1630,154 @@ class BazaarPlugin(Star):
                 result.append(token)
         return result
 
-    def _load_data(self):
+    async def _load_data(self):
+        """在工作线程中并行读取并解析数据文件，解析完成后在事件循环中一次性替换数据并重建索引"""
         data_dir = self.plugin_dir / "data"
-
-        for name, attr, default in [
+        sources = [
             ("monsters_db.json", "monsters", {}),
             ("items_db.json", "items", []),
             ("skills_db.json", "skills", []),
             ("event_detail.json", "events", []),
             ("merchants_db.json", "merchants", []),
-        ]:
-            path = data_dir / name
-            try:
-                if path.exists():
-                    with open(path, "r", encoding="utf-8") as f:
-                        setattr(self, attr, json.load(f))
-                else:
-                    logger.warning(f"数据文件不存在: {path}")
-                    setattr(self, attr, default)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.error(f"加载数据失败 ({name}): {e}")
-                setattr(self, attr, default)
+        ]
+        *loaded, encounters = await asyncio.gather(
+            *(asyncio.to_thread(self._read_data_file, data_dir / name, default)
+              for name, _, default in sources),
+            asyncio.to_thread(self._read_encounters, data_dir),
+        )
+        # 以下步骤之间没有 await，其他命令不会看到半更新的数据
+        for (_, attr, _), data in zip(sources, loaded):
+            setattr(self, attr, data)
+        self._data_version += 1
 
-        self._enrich_events(data_dir)
+        self._enrich_events(encounters)
+        self._prepare_search_fields()
         self._refresh_hero_metadata()
         self._load_aliases()
 
-    def _enrich_events(self, data_dir: Path):
+    def _prepare_search_fields(self):
+        """为各类数据预先生成小写搜索字段，以及与数据列表下标对齐的关键词拼接文本"""
+        self._search_results.clear()
+        # 三元组倒排索引：三字符片段 -> 条目下标，候选集合再用拼接文本校验
+        item_trigrams: dict[str, set[int]] = {}
+        item_blobs: list[str] = []
+        item_by_name: dict[str, dict] = {}
+        items_by_tier: dict[str, list[dict]] = {}
+        item_tag_index: dict[str, list[int]] = {}
+        all_tags = set()
+        heroes = set()
+        for i, item in enumerate(self.items):
+            _intern_fields(item, ITEM_INTERN_FIELDS)
+            _attach_lowercase(item, ITEM_SEARCH_FIELDS)
+            tier = sys.intern(_clean_tier(item.get("starting_tier", "")))
+            item["_tier"] = tier
+            items_by_tier.setdefault(tier, []).append(item)
+            # 标签条件按子串匹配的完整标签文本（标签 + 隐藏标签）
+            item["_lc_all_tags"] = item["_lc_tags"] + " " + item["_lc_hidden_tags"]
+            for t in item.get("tags", "").split("|"):
+                for p in t.strip().split("/"):
+                    p = p.strip()
+                    if p:
+                        all_tags.add(p)
+            for t in item["_lc_all_tags"].replace("|", "/").split("/"):
+                t = t.strip()
+                if t:
+                    ids = item_tag_index.setdefault(t, [])
+                    if not ids or ids[-1] != i:
+                        ids.append(i)
+            for p in item.get("heroes", "").split("/"):
+                p = p.strip()
+                if p:
+                    heroes.add(p)
+            for name in (item["_lc_name_cn"], item["_lc_name_en"]):
+                if name:
+                    item_by_name.setdefault(name, item)
+            blob = SEARCH_BLOB_SEP.join(item["_lc_" + f] for f in ITEM_KEYWORD_FIELDS)
+            item_blobs.append(blob)
+            _add_trigrams(item_trigrams, i, (blob,))
+        self._item_trigrams = item_trigrams
+        self._item_blobs = item_blobs
+        self._item_by_name = item_by_name
+        self._items_by_tier = items_by_tier
+        self._item_tag_index = item_tag_index
+        self._tags_sorted = sorted(all_tags)
+        self._item_heroes_sorted = sorted(heroes)
+        skill_trigrams: dict[str, set[int]] = {}
+        skill_blobs: list[str] = []
+        for i, skill in enumerate(self.skills):
+            _attach_lowercase(skill, SKILL_SEARCH_FIELDS)
+            blob = SEARCH_BLOB_SEP.join(skill["_lc_" + f] for f in SKILL_SEARCH_FIELDS)
+            skill_blobs.append(blob)
+            _add_trigrams(skill_trigrams, i, (blob,))
+        self._skill_trigrams = skill_trigrams
+        self._skill_blobs = skill_blobs
+        monster_trigrams: dict[str, set[int]] = {}
+        monster_blobs: list[str] = []
+        monster_by_name: dict[str, tuple[str, dict]] = {}
+        monster_item_by_name: dict[str, tuple[str, dict, dict]] = {}
+        self._monster_entries = list(self.monsters.items())
+        for i, (key, monster) in enumerate(self._monster_entries):
+            monster["_lc_key"] = key.lower()
+            monster["_unique_items"] = _unique_monster_items(monster.get("items", []))
+            _attach_lowercase(monster, MONSTER_SEARCH_FIELDS)
+            texts = [monster["_lc_key"], monster["_lc_name"], monster["_lc_name_zh"]]
+            for name in texts:
+                if name:
+                    monster_by_name.setdefault(name, (key, monster))
+            for entry in monster.get("skills", []):
+                _intern_fields(entry, MONSTER_ENTRY_INTERN_FIELDS)
+                _attach_lowercase(entry, MONSTER_ENTRY_SEARCH_FIELDS)
+                texts.append(entry["_lc_name"])
+                texts.append(entry["_lc_name_en"])
+            for entry in monster.get("items", []):
+                _intern_fields(entry, MONSTER_ENTRY_INTERN_FIELDS)
+                _attach_lowercase(entry, MONSTER_ENTRY_SEARCH_FIELDS)
+                texts.append(entry["_lc_name"])
+                texts.append(entry["_lc_name_en"])
+                for name in (entry["_lc_name"], entry["_lc_name_en"]):
+                    if name:
+                        monster_item_by_name.setdefault(name, (key, monster, entry))
+            blob = SEARCH_BLOB_SEP.join(texts)
+            monster_blobs.append(blob)
+            _add_trigrams(monster_trigrams, i, (blob,))
+        self._monster_trigrams = monster_trigrams
+        self._monster_blobs = monster_blobs
+        self._monster_by_name = monster_by_name
+        self._monster_item_by_name = monster_item_by_name
+        event_blobs: list[str] = []
+        for ev in self.events:
+            _attach_lowercase(ev, EVENT_SEARCH_FIELDS)
+            ev["_lc_heroes"] = [h.lower() for h in ev.get("heroes", [])]
+            texts = [ev["_lc_name"], ev["_lc_name_en"]]
+            for choice in ev.get("choices", []):
+                _attach_lowercase(choice, EVENT_CHOICE_SEARCH_FIELDS)
+                texts.extend(choice["_lc_" + f] for f in EVENT_CHOICE_SEARCH_FIELDS)
+            event_blobs.append(SEARCH_BLOB_SEP.join(texts))
+        self._event_blobs = event_blobs
+
+    @staticmethod
+    def _read_data_file(path: Path, default):
+        try:
+            if path.exists():
+                return _read_json(path)
+            logger.warning(f"数据文件不存在: {path}")
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error(f"加载数据失败 ({path.name}): {e}")
+        return default
+
+    @staticmethod
+    def _read_encounters(data_dir: Path) -> list | None:
         enc_path = data_dir / "event_encounters.json"
-        if not enc_path.exists() or not self.events:
-            return
+        if not enc_path.exists():
+            return None
         try:
-            with open(enc_path, "r", encoding="utf-8") as f:
-                encounters = json.load(f)
+            return _read_json(enc_path)
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f"加载 event_encounters.json 失败: {e}")
+            return None
+
+    def _enrich_events(self, encounters: list | None):
+        if not encounters or not self.events:
             return
 
         enc_map = {}
@@ -1528,26 +1857,17 @@ class BazaarPlugin(Star):
                         (v for v in tiers.values() if v), None
                     )
                     if tier_data and tier_data.get("description"):
-                        for desc_line in tier_data["description"][:2]:
-                            lines.append(f"    {desc_line}")
+                        lines.extend([f"    {desc_line}" for desc_line in tier_data["description"][:2]])
             if len(skills) > 8:
                 lines.append(f"  ... 还有{len(skills) - 8}个技能")
             lines.append("")
 
-        items = monster.get("items", [])
+        items = monster.get("_unique_items")
+        if items is None:
+            items = _unique_monster_items(monster.get("items", []))
         if items:
             lines.append("🎒 物品:")
-            seen = set()
-            count = 0
-            for item in items:
-                item_id = item.get("id", item.get("name", ""))
-                if item_id in seen:
-                    continue
-                seen.add(item_id)
-                count += 1
-                if count > 8:
-                    lines.append(f"  ... 还有{len(set(it.get('id', it.get('name','')) for it in items)) - 8}个物品")
-                    break
+            for item in items[:8]:
                 name = item.get("name", "")
                 name_en = item.get("name_en", "")
                 tier_str = item.get("tier", item.get("current_tier", ""))
@@ -1565,6 +1885,8 @@ class BazaarPlugin(Star):
                     )
                     if tier_data and tier_data.get("description"):
                         lines.append(f"    {tier_data['description'][0]}")
+            if len(items) > 8:
+                lines.append(f"  ... 还有{len(items) - 8}个物品")
 
         return "\n".join(lines)
 
@@ -1580,15 +1902,13 @@ class BazaarPlugin(Star):
         active_skills = item.get("skills", [])
         if active_skills:
             lines.append("⚔️ 主动技能:")
-            for sk in active_skills[:5]:
-                lines.append(f"  {_get_skill_text(sk)}")
+            lines.extend([f"  {_get_skill_text(sk)}" for sk in active_skills[:5]])
             lines.append("")
 
         passive_skills = item.get("skills_passive", [])
         if passive_skills:
             lines.append("🛡️ 被动技能:")
-            for sk in passive_skills[:5]:
-                lines.append(f"  {_get_skill_text(sk)}")
+            lines.extend([f"  {_get_skill_text(sk)}" for sk in passive_skills[:5]])
             lines.append("")
 
         details = []
@@ -1621,27 +1941,14 @@ class BazaarPlugin(Star):
 
         if details:
             lines.append("📊 属性:")
-            for d in details:
-                lines.append(f"  {d}")
+            lines.extend([f"  {d}" for d in details])
             lines.append("")
 
-        stat_fields = [
-            ("damage", "damage_tiers", "伤害"),
-            ("heal", "heal_tiers", "治疗"),
-            ("shield", "shield_tiers", "护盾"),
-            ("burn", "burn_tiers", "灼烧"),
-            ("poison", "poison_tiers", "中毒"),
-            ("regen", "regen_tiers", "再生"),
-            ("lifesteal", "lifesteal_tiers", "吸血"),
-            ("ammo", "ammo_tiers", "弹药"),
-            ("crit", "crit_tiers", "暴击"),
-            ("multicast", "multicast_tiers", "多重触发"),
-        ]
         stats = []
-        for val_key, tier_key, label in stat_fields:
+        for val_key, tier_key, label in ITEM_STAT_FIELDS:
             val = item.get(val_key)
-            tiers_str = item.get(tier_key, "")
             if val and val != 0:
+                tiers_str = item.get(tier_key, "")
                 if tiers_str:
                     stats.append(f"  {label}: {val} (成长: {tiers_str})")
                 else:
@@ -1655,11 +1962,12 @@ class BazaarPlugin(Star):
         enchantments = item.get("enchantments", {})
         if enchantments and isinstance(enchantments, dict):
             lines.append(f"✨ 附魔 ({len(enchantments)}种):")
-            for ench_key, ench_data in enchantments.items():
-                if isinstance(ench_data, dict):
-                    ench_cn = ench_data.get("name_cn", ench_key)
-                    effect = ench_data.get("effect_cn", ench_data.get("effect_en", ""))
-                    lines.append(f"  • {ench_cn}({ench_key}): {effect}")
+            lines.extend([
+                f"  • {ench_data.get('name_cn', ench_key)}({ench_key}): "
+                f"{ench_data.get('effect_cn', ench_data.get('effect_en', ''))}"
+                for ench_key, ench_data in enchantments.items()
+                if isinstance(ench_data, dict)
+            ])
             lines.append("")
 
         quests = item.get("quests") or []
@@ -1716,10 +2024,7 @@ class BazaarPlugin(Star):
         if descriptions and len(descriptions) > 1:
             lines.append("")
             lines.append("📋 各品质描述:")
-            for desc in descriptions[:4]:
-                cn = desc.get("cn", "")
-                if cn:
-                    lines.append(f"  • {cn}")
+            lines.extend([f"  • {desc['cn']}" for desc in descriptions[:4] if desc.get("cn")])
 
         return "\n".join(lines)
 
@@ -1838,72 +2143,62 @@ class BazaarPlugin(Star):
     def _search_events(self, keyword: str, heroes: list = None) -> list:
         results = []
         kw = keyword.lower() if keyword else ""
-        for ev in self.events:
+        heroes_lc = [h.lower() for h in heroes] if heroes else []
+        for ev, blob in zip(self.events, self._event_blobs):
             if heroes:
-                ev_heroes = [h.lower() for h in ev.get("heroes", [])]
-                if not any(h.lower() in ev_heroes for h in heroes):
+                ev_heroes = ev["_lc_heroes"]
+                if not any(h in ev_heroes for h in heroes_lc):
                     continue
-            if not kw:
-                results.append(ev)
-                continue
-            if (kw in ev.get("name", "").lower() or
-                kw in ev.get("name_en", "").lower()):
+            if not kw or kw in blob:
                 results.append(ev)
-                continue
-            for choice in ev.get("choices", []):
-                if (kw in choice.get("name", "").lower() or
-                    kw in choice.get("name_zh", "").lower() or
-                    kw in choice.get("description_zh", "").lower() or
-                    kw in choice.get("description", "").lower()):
-                    results.append(ev)
-                    break
-        return results
-
-    def _search_monsters(self, keyword: str) -> list:
-        results = []
-        kw = keyword.lower()
-        for key, monster in self.monsters.items():
-            if (kw in key.lower() or
-                kw in monster.get("name", "").lower() or
-                kw in monster.get("name_zh", "").lower()):
-                results.append((key, monster))
-                continue
-            for skill in monster.get("skills", []):
-                if (kw in skill.get("name", "").lower() or
-                    kw in skill.get("name_en", "").lower()):
-                    results.append((key, monster))
-                    break
-            else:
-                for item in monster.get("items", []):
-                    if (kw in item.get("name", "").lower() or
-                        kw in item.get("name_en", "").lower()):
-                        results.append((key, monster))
-                        break
         return results
 
-    def _search_items(self, keyword: str) -> list:
-        results = []
-        kw = keyword.lower()
-        for item in self.items:
-            if (kw in item.get("name_cn", "").lower() or
-                kw in item.get("name_en", "").lower() or
-                kw in item.get("tags", "").lower() or
-                kw in item.get("hidden_tags", "").lower() or
-                kw in item.get("heroes", "").lower()):
-                results.append(item)
+    def _cached_search(self, kind: str, kw: str, scan) -> tuple:
+        """按 (类型, 小写关键词) 缓存搜索结果；结果为只读元组，数据重载时整体清空"""
+        key = (kind, kw)
+        cache = self._search_results
+        results = cache.get(key)
+        if results is not None:
+            cache.move_to_end(key)
+            return results
+        results = tuple(scan(kw))
+        cache[key] = results
+        if len(cache) > SEARCH_RESULT_CACHE_SIZE:
+            cache.popitem(last=False)
         return results
 
-    def _search_skills(self, keyword: str) -> list:
-        results = []
-        kw = keyword.lower()
-        for skill in self.skills:
-            if (kw in skill.get("name_cn", "").lower() or
-                kw in skill.get("name_en", "").lower() or
-                kw in skill.get("description_cn", "").lower() or
-                kw in skill.get("description_en", "").lower() or
-                kw in skill.get("heroes", "").lower()):
-                results.append(skill)
-        return results
+    def _search_monsters(self, keyword: str) -> tuple:
+        return self._cached_search("monster", keyword.lower(), self._scan_monsters)
+
+    def _search_items(self, keyword: str) -> tuple:
+        return self._cached_search("item", keyword.lower(), self._scan_items)
+
+    def _search_skills(self, keyword: str) -> tuple:
+        return self._cached_search("skill", keyword.lower(), self._scan_skills)
+
+    def _scan_monsters(self, kw: str) -> list:
+        candidates = _trigram_candidates(self._monster_trigrams, kw)
+        entries = self._monster_entries
+        blobs = self._monster_blobs
+        if candidates is None:
+            return [entry for entry, blob in zip(entries, blobs) if kw in blob]
+        return [entries[i] for i in candidates if kw in blobs[i]]
+
+    def _scan_items(self, kw: str) -> list:
+        candidates = _trigram_candidates(self._item_trigrams, kw)
+        items = self.items
+        blobs = self._item_blobs
+        if candidates is None:
+            return [item for item, blob in zip(items, blobs) if kw in blob]
+        return [items[i] for i in candidates if kw in blobs[i]]
+
+    def _scan_skills(self, kw: str) -> list:
+        candidates = _trigram_candidates(self._skill_trigrams, kw)
+        skills = self.skills
+        blobs = self._skill_blobs
+        if candidates is None:
+            return [skill for skill, blob in zip(skills, blobs) if kw in blob]
+        return [skills[i] for i in candidates if kw in blobs[i]]
 
     def _search_merchants(self, keyword: str) -> list:
         results = []
@@ -1924,7 +2219,7 @@ class BazaarPlugin(Star):
         tier = merchant.get("tier", "")
         heroes = merchant.get("heroes", [])
         category_cn = "商人" if category == "Merchant" else "训练师" if category == "Trainer" else category
-        tier_cn = {"Bronze": "青铜", "Silver": "白银", "Gold": "黄金", "Diamond": "钻石", "Legendary": "传说"}.get(tier, tier)
+        tier_cn = TIER_CN_MAP.get(tier, tier)
         heroes_cn = [f"{self._hero_cn_map.get(h, h)}" for h in heroes]
         lines = [
             f"🏪 {name}",
@@ -1946,46 +2241,7 @@ class BazaarPlugin(Star):
             "🎮 The Bazaar 数据查询助手\n"
             "━━━━━━━━━━━━━━━━━━\n"
             f"📊 数据: {len(self.monsters)}怪物 | {len(self.items)}物品 | {len(self.skills)}技能 | {len(self.events)}事件 | {len(self.merchants)}商人\n\n"
-            "📋 可用指令:\n\n"
-            "/tbzmonster <名称> - 查询怪物详情(图片卡片)\n"
-            "  示例: /tbzmonster 火灵\n\n"
-            "/tbzitem <名称> - 查询物品详情(图片卡片)\n"
-            "  示例: /tbzitem 地下商街\n\n"
-            "/tbzskill <名称> - 查询技能详情(图片卡片)\n"
-            "  示例: /tbzskill 热情如火\n\n"
-            "/tbzevent <名称> - 查询事件选项\n"
-            "  示例: /tbzevent 奇异蘑菇\n\n"
-            "/tbzsearch <条件> - 智能多条件搜索\n"
-            "  直接连写: /tbzsearch 杜利中型灼烧\n"
-            "  空格分隔: /tbzsearch 马克 黄金 武器\n"
-            "  前缀语法: /tbzsearch tag:Weapon hero:Mak\n"
-            "  英雄事件: /tbzsearch hero:Jules (含该英雄事件)\n"
-            "  无参数: /tbzsearch (显示搜索帮助)\n\n"
-            "/tbznews [数量] - 查询游戏官方更新公告(图片)\n"
-            "  示例: /tbznews 或 /tbznews 3\n\n"
-            "/tbzpatch [版本号] - 查询中文补丁说明\n"
-            "  示例: /tbzpatch 或 /tbzpatch 11.0\n\n"
-            "/tbzbuild <物品名> [数量] - 查询推荐阵容\n"
-            "  示例: /tbzbuild 符文匕首\n\n"
-            "/tbztier <英雄名> - 查询英雄物品评级(Tier List)\n"
-            "  示例: /tbztier 海盗 或 /tbztier Vanessa\n\n"
-            "/tbzguide <英雄名> - 查询英雄一图流攻略\n"
-            "  示例: /tbzguide 海盗 或 /tbzguide Vanessa\n\n"
-            "/tbzmerchant <名称> - 查询商人/训练师信息\n"
-            "  示例: /tbzmerchant Aila 或 /tbzmerchant Weapon\n\n"
-            "/tbzalias - 别名管理(查看/添加/删除)\n"
-            "  查看: /tbzalias list [分类]\n"
-            "  添加: /tbzalias add hero 猪猪 Pygmalien\n"
-            "  删除: /tbzalias del hero 猪猪\n\n"
-            "/tbzupdate - 从远端更新游戏数据\n\n"
-            "/tbzcache - 查看/清理缓存\n"
-            "  /tbzcache stats - 查看缓存统计\n"
-            "  /tbzcache clear - 清理内存缓存\n\n"
-            "/tbzhelp - 显示此帮助信息\n"
-            "━━━━━━━━━━━━━━━━━━\n"
-            "数据来源: BazaarHelper | BazaarForge | bazaar-builds.net | Steam\n\n"
-            "💡 AI 工具: 本插件支持 AI 自动调用，需要 AstrBot 配置支持函数调用的 LLM 模型"
-        )
+        ) + HELP_COMMANDS_TEXT
         yield event.plain_result(help_text)
 
     @filter.command("tbzcache")
@@ -2282,17 +2538,7 @@ class BazaarPlugin(Star):
             return
 
         query = self._resolve_alias(query)
-        kw = query.lower()
-        found_key = None
-        found_monster = None
-
-        for key, monster in self.monsters.items():
-            if (key == query or
-                monster.get("name", "").lower() == kw or
-                monster.get("name_zh", "").lower() == kw):
-                found_key = key
-                found_monster = monster
-                break
+        found_key, found_monster = self._monster_by_name.get(query.lower(), (None, None))
 
         if not found_monster:
             results = self._search_monsters(query)
@@ -2310,7 +2556,10 @@ class BazaarPlugin(Star):
 
         if self.renderer:
             try:
-                img_bytes = await self.renderer.render_monster_card(found_key, found_monster)
+                img_bytes = await self._render_card_cached(
+                    f"monster:{found_key}",
+                    lambda: self.renderer.render_monster_card(found_key, found_monster),
+                )
                 yield event.chain_result([Comp.Image.fromBytes(img_bytes)])
                 return
             except Exception as e:
@@ -2327,13 +2576,7 @@ class BazaarPlugin(Star):
 
         query = self._resolve_alias(query)
         kw = query.lower()
-        found = None
-
-        for item in self.items:
-            if (item.get("name_cn", "").lower() == kw or
-                item.get("name_en", "").lower() == kw):
-                found = item
-                break
+        found = self._item_by_name.get(kw)
 
         if not found:
             results = self._search_items(query)
@@ -2347,31 +2590,28 @@ class BazaarPlugin(Star):
                 yield event.plain_result(msg)
                 return
 
-        if not found:
-            for key, monster in self.monsters.items():
-                for mitem in monster.get("items", []):
-                    if (mitem.get("name", "").lower() == kw or
-                        mitem.get("name_en", "").lower() == kw):
-                        tier_str = mitem.get("tier", mitem.get("current_tier", ""))
-                        tier_clean = _clean_tier(tier_str)
-                        tier_emoji = TIER_EMOJI.get(tier_clean, "")
-                        desc_parts = []
-                        tiers = mitem.get("tiers", {})
-                        if tiers:
-                            current = mitem.get("current_tier", "").lower()
-                            tier_data = tiers.get(current) or next(
-                                (v for v in tiers.values() if v), None
-                            )
-                            if tier_data and tier_data.get("description"):
-                                desc_parts = tier_data["description"]
-                        desc_text = "\n".join(desc_parts) if desc_parts else "暂无描述"
-                        result = (
-                            f"📦 【{mitem['name']}】 {tier_emoji}{tier_str}\n\n"
-                            f"📝 {desc_text}\n\n"
-                            f"🐉 所属怪物: {monster.get('name_zh', key)}({monster.get('name', '')})"
-                        )
-                        yield event.plain_result(result)
-                        return
+        if not found and kw in self._monster_item_by_name:
+            key, monster, mitem = self._monster_item_by_name[kw]
+            tier_str = mitem.get("tier", mitem.get("current_tier", ""))
+            tier_clean = _clean_tier(tier_str)
+            tier_emoji = TIER_EMOJI.get(tier_clean, "")
+            desc_parts = []
+            tiers = mitem.get("tiers", {})
+            if tiers:
+                current = mitem.get("current_tier", "").lower()
+                tier_data = tiers.get(current) or next(
+                    (v for v in tiers.values() if v), None
+                )
+                if tier_data and tier_data.get("description"):
+                    desc_parts = tier_data["description"]
+            desc_text = "\n".join(desc_parts) if desc_parts else "暂无描述"
+            result = (
+                f"📦 【{mitem['name']}】 {tier_emoji}{tier_str}\n\n"
+                f"📝 {desc_text}\n\n"
+                f"🐉 所属怪物: {monster.get('name_zh', key)}({monster.get('name', '')})"
+            )
+            yield event.plain_result(result)
+            return
 
         if not found:
             yield event.plain_result(self._not_found_with_suggestions(query, "物品"))
@@ -2379,7 +2619,10 @@ class BazaarPlugin(Star):
 
         if self.renderer:
             try:
-                img_bytes = await self.renderer.render_item_card(found)
+                img_bytes = await self._render_card_cached(
+                    f"item:{found.get('id') or found.get('name_en', '')}",
+                    lambda: self.renderer.render_item_card(found),
+                )
                 yield event.chain_result([Comp.Image.fromBytes(img_bytes)])
                 return
             except Exception as e:
@@ -2418,7 +2661,10 @@ class BazaarPlugin(Star):
 
         if self.renderer:
             try:
-                img_bytes = await self.renderer.render_skill_card(found)
+                img_bytes = await self._render_card_cached(
+                    f"skill:{found.get('id') or found.get('name_en', '')}",
+                    lambda: self.renderer.render_skill_card(found),
+                )
                 yield event.chain_result([Comp.Image.fromBytes(img_bytes)])
                 return
             except Exception as e:
@@ -2497,113 +2743,84 @@ class BazaarPlugin(Star):
         conditions["keyword"] = " ".join(keywords)
         return conditions
 
+    def _items_with_tag(self, tag: str) -> list:
+        """标签（小写）按子串命中的物品，保持数据顺序；结果与逐条比对标签文本一致"""
+        if any(c in tag for c in TAG_SEPARATOR_CHARS):
+            # 含分隔符的条件可能跨越多个标签，只能逐条比对
+            return [item for item in self.items if tag in item["_lc_all_tags"]]
+        hits = [ids for key, ids in self._item_tag_index.items() if tag in key]
+        if len(hits) == 1:
+            indices = hits[0]
+        else:
+            indices = sorted(set().union(*hits))
+        items = self.items
+        return [items[i] for i in indices]
+
     def _filter_items(self, conditions: dict) -> list:
         results = self.items
+        # 标签条件先查标签索引取候选，其余标签用预先拼接的标签文本校验
         if conditions["tags"]:
-            filtered = []
-            for item in results:
-                item_tags = (item.get("tags", "") + " " + item.get("hidden_tags", "")).lower()
-                if all(t.lower() in item_tags for t in conditions["tags"]):
-                    filtered.append(item)
-            results = filtered
+            tags_lc = [t.lower() for t in conditions["tags"]]
+            results = self._items_with_tag(tags_lc[0])
+            if len(tags_lc) > 1:
+                results = [item for item in results if all(t in item["_lc_all_tags"] for t in tags_lc[1:])]
+        # 没有标签条件时，单一品质直接取预先分好的桶
         if conditions["tiers"]:
-            filtered = []
-            for item in results:
-                tier = _clean_tier(item.get("starting_tier", ""))
-                if tier in conditions["tiers"]:
-                    filtered.append(item)
-            results = filtered
+            tiers = set(conditions["tiers"])
+            if results is self.items and len(tiers) == 1:
+                results = self._items_by_tier.get(next(iter(tiers)), [])
+            else:
+                results = [item for item in results if item["_tier"] in tiers]
         if conditions["heroes"]:
             filtered = []
+            heroes_lc = [h.lower() for h in conditions["heroes"]]
             for item in results:
-                hero_str = item.get("heroes", "").lower()
-                if all(h.lower() in hero_str for h in conditions["heroes"]):
+                hero_str = item["_lc_heroes"]
+                if all(h in hero_str for h in heroes_lc):
                     filtered.append(item)
             results = filtered
         if conditions.get("sizes"):
             filtered = []
+            sizes_lc = [s.lower() for s in conditions["sizes"]]
             for item in results:
-                size_str = item.get("size", "").lower()
-                if any(s.lower() in size_str for s in conditions["sizes"]):
+                size_str = item["_lc_size"]
+                if any(s in size_str for s in sizes_lc):
                     filtered.append(item)
             results = filtered
         if conditions["keyword"]:
             kw = conditions["keyword"].lower()
             filtered = []
             for item in results:
-                searchable = " ".join([
-                    item.get("name_cn", ""), item.get("name_en", ""),
-                    item.get("tags", ""), item.get("hidden_tags", ""),
-                    item.get("heroes", ""), item.get("size", ""),
-                ]).lower()
+                searchable = " ".join(item["_lc_" + f] for f in ITEM_SEARCH_FIELDS)
                 if kw in searchable:
                     filtered.append(item)
             results = filtered
         return results
 
     def _filter_skills(self, conditions: dict) -> list:
-        results = self.skills
+        pairs = list(zip(self.skills, self._skill_blobs))
         if conditions["heroes"]:
             filtered = []
-            for skill in results:
-                hero_str = skill.get("heroes", "").lower()
-                if all(h.lower() in hero_str for h in conditions["heroes"]):
-                    filtered.append(skill)
-            results = filtered
+            heroes_lc = [h.lower() for h in conditions["heroes"]]
+            for skill, blob in pairs:
+                hero_str = skill["_lc_heroes"]
+                if all(h in hero_str for h in heroes_lc):
+                    filtered.append((skill, blob))
+            pairs = filtered
         if conditions["keyword"]:
             kw = conditions["keyword"].lower()
-            filtered = []
-            for skill in results:
-                if (kw in skill.get("name_cn", "").lower() or
-                    kw in skill.get("name_en", "").lower() or
-                    kw in skill.get("description_cn", "").lower() or
-                    kw in skill.get("description_en", "").lower() or
-                    kw in skill.get("heroes", "").lower()):
-                    filtered.append(skill)
-            results = filtered
-        return results
+            pairs = [(skill, blob) for skill, blob in pairs if kw in blob]
+        return [skill for skill, _ in pairs]
 
     def _get_search_help(self) -> str:
-        all_tags = set()
-        for item in self.items:
-            for t in item.get("tags", "").split("|"):
-                for p in t.strip().split("/"):
-                    p = p.strip()
-                    if p:
-                        all_tags.add(p)
-        heroes = set()
-        for item in self.items:
-            hero_str = item.get("heroes", "")
-            if hero_str:
-                for p in hero_str.split("/"):
-                    p = p.strip()
-                    if p:
-                        heroes.add(p)
-        sorted_tags = sorted(all_tags)
-        sorted_heroes = sorted(heroes)
-        return (
-            "🔍 多条件搜索帮助\n"
-            "━━━━━━━━━━━━━━━━━━\n"
-            "用法: /tbzsearch [条件...]\n\n"
-            "支持智能识别，可直接连写条件，无需前缀:\n"
-            "  /tbzsearch 杜利中型灼烧\n"
-            "  /tbzsearch 马克黄金武器\n"
-            "  /tbzsearch 青铜食物\n\n"
-            "也支持前缀语法:\n"
-            "  tag:标签名 / 标签:标签名\n"
-            "  tier:品质 / 品质:品质名\n"
-            "  hero:英雄 / 英雄:英雄名\n"
-            "  size:尺寸 / 尺寸:尺寸名\n\n"
-            "示例:\n"
-            "  /tbzsearch 灼烧\n"
-            "  /tbzsearch tag:Weapon hero:Mak\n"
-            "  /tbzsearch tier:Gold tag:Weapon\n\n"
+        sorted_tags = self._tags_sorted
+        sorted_heroes = self._item_heroes_sorted
+        return SEARCH_HELP_USAGE_TEXT + (
             f"🏷️ 可用标签 ({len(sorted_tags)}个):\n"
             f"  {', '.join(sorted_tags)}\n\n"
             f"🦸 可用英雄 ({len(sorted_heroes)}个):\n"
             f"  {', '.join(sorted_heroes)}\n\n"
-            "📊 品质: Bronze(青铜), Silver(白银), Gold(黄金), Diamond(钻石)"
-        )
+        ) + SEARCH_HELP_TIERS_TEXT
 
     @filter.command("tbzsearch")
     async def cmd_search(self, event: AstrMessageEvent):
@@ -2749,9 +2966,7 @@ class BazaarPlugin(Star):
                         continue
                     raw = await resp.text()
                     data = json.loads(raw)
-                    filepath = data_dir / filename
-                    with open(filepath, "w", encoding="utf-8") as f:
-                        f.write(raw)
+                    _write_compact_json(data_dir / filename, data)
                     count = len(data) if isinstance(data, (list, dict)) else 0
                     results.append(f"✅ {filename}: {count}条数据")
                     success_count += 1
@@ -2766,9 +2981,7 @@ class BazaarPlugin(Star):
             async with session.get(forge_url, params=params, headers=FORGE_HEADERS) as resp:
                 if resp.status == 200:
                     merchants_data = await resp.json()
-                    filepath = data_dir / "merchants_db.json"
-                    with open(filepath, "w", encoding="utf-8") as f:
-                        json.dump(merchants_data, f, ensure_ascii=False, indent=2)
+                    _write_compact_json(data_dir / "merchants_db.json", merchants_data)
                     results.append(f"✅ merchants_db.json: {len(merchants_data)}条数据 (BazaarForge)")
                     success_count += 1
                 else:
@@ -2777,7 +2990,7 @@ class BazaarPlugin(Star):
             results.append(f"❌ merchants_db.json: {e}")
 
         if success_count > 0:
-            self._load_data()
+            await self._load_data()
             self._build_vocab()
 
         hero_text = self._hero_options_text()
@@ -3343,13 +3556,7 @@ class BazaarPlugin(Star):
         '''
         query = self._resolve_alias(item_name)
         kw = query.lower()
-        found = None
-
-        for item in self.items:
-            if (item.get("name_cn", "").lower() == kw or
-                item.get("name_en", "").lower() == kw):
-                found = item
-                break
+        found = self._item_by_name.get(kw)
 
         if not found:
             results = self._search_items(query)
@@ -3376,17 +3583,7 @@ class BazaarPlugin(Star):
             monster_name(string): The Bazaar 游戏怪物名称，支持中文或英文。例如：火灵、Tree Treant、暗影猎手
         '''
         query = self._resolve_alias(monster_name)
-        kw = query.lower()
-        found_key = None
-        found_monster = None
-
-        for key, monster in self.monsters.items():
-            if (key == query or
-                monster.get("name", "").lower() == kw or
-                monster.get("name_zh", "").lower() == kw):
-                found_key = key
-                found_monster = monster
-                break
+        found_key, found_monster = self._monster_by_name.get(query.lower(), (None, None))
 
         if not found_monster:
             results = self._search_monsters(query)
@@ -3571,13 +3768,7 @@ class BazaarPlugin(Star):
         """查询英雄物品 Tier List"""
         query = _extract_query(event.message_str, "tbztier")
         if not query:
-            yield event.plain_result(
-                "请输入英雄名称查询物品评级，例如:\n"
-                "  /tbztier 海盗\n"
-                "  /tbztier Vanessa\n"
-                "  /tbztier 杜利\n\n"
-                f"可用英雄: {self._hero_options_text()}"
-            )
+            yield event.plain_result(TIER_USAGE_TEXT + f"可用英雄: {self._hero_options_text()}")
             return
 
         query = self._resolve_alias(query)
@@ -3623,12 +3814,11 @@ class BazaarPlugin(Star):
                 logger.warning(f"Tier List 卡片渲染失败，回退文本: {e}")
 
         lines = [f"📊 {hero_cn}({hero_en}) 物品评级 (共{total}个)", ""]
-        grade_emoji = {"S": "🏆", "A": "🥇", "B": "🥈", "C": "🥉"}
         for grade in ["S", "A", "B", "C"]:
             items = tier_items.get(grade, [])
             if not items:
                 continue
-            lines.append(f"{grade_emoji.get(grade, '')} {grade} 级 ({len(items)}个):")
+            lines.append(f"{GRADE_EMOJI.get(grade, '')} {grade} 级 ({len(items)}个):")
             for it in items[:15]:
                 name_display = f"{it['name_cn']}({it['name']})" if it.get("name_cn") else it["name"]
                 lines.append(f"  {name_display} - {it['pct']:.1f}% ({it['build_count']}局)")
@@ -3786,6 +3976,8 @@ class BazaarPlugin(Star):
         yield event.plain_result(self._format_merchant_info(found))
 
     async def terminate(self):
+        if self.renderer:
+            await self.renderer.close()
         if self._session and not self._session.closed:
             await self._session.close()
         logger.info("Bazaar 插件已卸载")
@@ -0,0 +1,47 @@
+from PIL import ImageFont
+
+from card_renderer import CardRenderer
+
+FONT = ImageFont.load_default(size=20)
+
+
+def greedy_wrap(text, font, max_width):
+    """逐词贪心换行（优化前的实现），作为对照"""
+    lines = []
+    for paragraph in text.split("\n"):
+        if not paragraph.strip():
+            lines.append("")
+            continue
+        current = ""
+        for word in paragraph.split(" "):
+            test = f"{current} {word}" if current else word
+            if font.getlength(test) > max_width and current:
+                lines.append(current)
+                current = word
+            else:
+                current = test
+        if current:
+            lines.append(current)
+    return lines
+
+
+def test_wrap_matches_greedy_with_extra_spaces(tmp_path):
+    renderer = CardRenderer(tmp_path)
+    texts = [
+        "Freeze  items for  second(s)",
+        "Freeze  items for  second(s) and  deal  damage  to  every  enemy  item",
+        " If this is adjacent to a Weapon, it gains  Haste",
+        "  Leading  and trailing  spaces  ",
+        "Line one  with gaps\n\n If this is adjacent  to a Tool",
+    ]
+    for text in texts:
+        for width in (40, 80, 120, 200, 400):
+            assert renderer._wrap_text(text, FONT, width) == greedy_wrap(text, FONT, width), (text, width)
+
+
+def test_wrap_overlong_word(tmp_path):
+    renderer = CardRenderer(tmp_path)
+    url = "https://playthebazaar.com/news/patch-notes-0-1-5-hotfix-2-and-some-more-long-slug-text"
+    # 不含空格与 CJK 的超宽段落：整段只有一个单元，原样占一行
+    assert renderer._wrap_text(url, FONT, 200) == [url]
+    assert renderer._wrap_text(f"{url}\nsee above", FONT, 200) == [url, "see above"]